@@ -1,10 +1,134 @@
+import functools
+import os
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
 import pandas as pd
-from typing import Optional
+from numba import njit
+from typing import Optional, Union
 from strategies.base import Strategy
 from .portfolio import Portfolio
 from .trade import Trade, BacktestResult
 from metrics import calculate_all_metrics
 
+# bars x jobs below which max_workers=None runs in this process, smaller sweeps
+# finish sequentially before a process pool has started and received the data
+_PARALLEL_MIN_WORK = 1_000_000
+
+# worker failures that mean the jobs could not be shipped to or from a process,
+# e.g. strategies defined in __main__ or a notebook that spawn workers cannot import
+_POOL_ERRORS = (BrokenProcessPool, pickle.PicklingError, pickle.UnpicklingError)
+
+def _run_one(
+    params: dict,
+    strategy: Strategy,
+    data: pd.DataFrame,
+    symbol: Optional[str],
+    signals: Optional[np.ndarray] = None
+) -> BacktestResult:
+    # run one backtest in a worker with a fresh backtester
+    # top-level so it can be pickled into a process pool
+    return Backtester(**params).run(strategy, data, symbol, signals=signals)
+
+def _run_shared_window(
+    params: dict,
+    strategy: Strategy,
+    close_path: str,
+    start: int,
+    end: int,
+    index: pd.DatetimeIndex,
+    symbol: Optional[str],
+    signals: np.ndarray
+) -> BacktestResult:
+    # run one walk-forward window against the memory-mapped close array
+    # the engine only reads close prices once signals are given
+    closes = np.load(close_path, mmap_mode='r')[start:end]
+    data = pd.DataFrame({'close': np.array(closes)}, index=index)
+    return Backtester(**params).run(strategy, data, symbol, signals=signals)
+
+@njit(cache=True)
+def _run_core(
+    closes: np.ndarray,
+    signals: np.ndarray,
+    initial_cash: float,
+    commission_pct: float,
+    slippage_pct: float,
+    position_size_pct: float
+):
+    # compiled single-symbol long-only event loop
+    # mirrors the python path: same fills, costs and end-of-data close
+    # returns per-bar cash and position value, per-trade arrays and final cash
+    n = len(closes)
+    max_trades = 1
+    for i in range(n):
+        if signals[i] == 1:
+            max_trades += 1
+
+    cash_history = np.empty(n)
+    position_value_history = np.empty(n)
+    entry_idx = np.empty(max_trades, dtype=np.int64)
+    exit_idx = np.empty(max_trades, dtype=np.int64)
+    trade_shares = np.empty(max_trades, dtype=np.int64)
+    entry_prices = np.empty(max_trades)
+    exit_prices = np.empty(max_trades)
+    entry_comms = np.empty(max_trades)
+    exit_comms = np.empty(max_trades)
+
+    cash = initial_cash
+    shares = 0
+    k = 0
+
+    for i in range(n):
+        price = closes[i]
+
+        if signals[i] == 1 and shares == 0:
+            exec_price = price * (1 + slippage_pct)
+            capital = cash * position_size_pct
+            if exec_price > 0 and capital > 0:
+                buy_shares = int(capital / (exec_price * (1 + commission_pct)))
+                if buy_shares > 0:
+                    commission = buy_shares * exec_price * commission_pct
+                    cost = buy_shares * exec_price + commission
+                    if cost <= cash:
+                        cash -= cost
+                        shares = buy_shares
+                        entry_idx[k] = i
+                        trade_shares[k] = buy_shares
+                        entry_prices[k] = exec_price
+                        entry_comms[k] = commission
+
+        elif signals[i] == -1 and shares > 0:
+            exec_price = price * (1 - slippage_pct)
+            commission = shares * exec_price * commission_pct
+            cash += shares * exec_price - commission
+            exit_idx[k] = i
+            exit_prices[k] = exec_price
+            exit_comms[k] = commission
+            k += 1
+            shares = 0
+
+        cash_history[i] = cash
+        position_value_history[i] = shares * price
+
+    # close remaining position at the last bar, after history is recorded
+    if shares > 0:
+        exec_price = closes[n - 1] * (1 - slippage_pct)
+        commission = shares * exec_price * commission_pct
+        cash += shares * exec_price - commission
+        exit_idx[k] = n - 1
+        exit_prices[k] = exec_price
+        exit_comms[k] = commission
+        k += 1
+
+    return (
+        cash_history, position_value_history,
+        entry_idx[:k], exit_idx[:k], trade_shares[:k],
+        entry_prices[:k], exit_prices[:k], entry_comms[:k], exit_comms[:k],
+        cash
+    )
+
 # execute strategies on historical data with realistic costs
 class Backtester:
 
@@ -13,15 +137,22 @@ class Backtester:
         initial_capital: float = 100000,
         commission_pct: float = 0.001,
         slippage_pct: float = 0.0005,
-        position_size_pct: float = 1.0
+        position_size_pct: float = 1.0,
+        engine: str = 'numba'
     ):
+        # engine: 'numba' runs the compiled event loop, 'python' the reference loop
+        if engine not in ('numba', 'python'):
+            raise ValueError(f"unknown engine: {engine}")
+
         self.initial_capital = initial_capital
         self.commission_pct = commission_pct
         self.slippage_pct = slippage_pct
         self.position_size_pct = position_size_pct
+        self.engine = engine
 
         self.portfolio: Optional[Portfolio] = None
         self.trades: list[Trade] = []
+        self.trade_arrays: Optional[dict] = None
         self.open_trade_entry: dict = {}
 
     def calculate_shares(self, price: float, available_capital: float) -> float:
@@ -47,41 +178,53 @@ class Backtester:
         self,
         strategy: Strategy,
         data: pd.DataFrame,
-        symbol: Optional[str] = None
+        symbol: Optional[str] = None,
+        signals: Optional[Union[pd.Series, np.ndarray]] = None
     ) -> BacktestResult:
         # run backtest on historical data
+        # signals: precomputed signals, a series on the data index or an array
+        # aligned with data rows, skips strategy.generate_signals when given
         if data.empty:
             raise ValueError("data cannot be empty")
         if 'close' not in data.columns:
             raise ValueError("data must contain 'close' column")
 
-        self.portfolio = Portfolio(self.initial_capital)
+        # reuse one portfolio across runs instead of allocating a new one each time
+        if self.portfolio is None:
+            self.portfolio = Portfolio(self.initial_capital)
+        self.portfolio.initial_cash = self.initial_capital
+        self.portfolio.reset()
+
         self.trades = []
+        self.trade_arrays = None
         self.open_trade_entry = {}
 
         symbol = symbol or 'UNKNOWN'
-        signals = strategy.generate_signals(data)
 
-        for date, row in data.iterrows():
-            current_price = row['close']
-            signal = signals.loc[date] if date in signals.index else 0
-            current_prices = {symbol: current_price}
+        # work on raw arrays, signals are aligned to the data index once
+        # so lookups inside the event loop are positional
+        closes = data['close'].to_numpy(dtype=np.float64)
+        dates = data.index
 
-            if signal == 1:
-                self._process_buy_signal(symbol, date, current_price)
-            elif signal == -1:
-                self._process_sell_signal(symbol, date, current_price)
+        if signals is None:
+            signals = strategy.generate_signals(data)
 
-            self.portfolio.update_history(date, current_prices)
+        if isinstance(signals, pd.Series):
+            signals = signals.reindex(data.index).to_numpy(dtype=np.float64)
+        elif len(signals) != len(data):
+            raise ValueError(
+                f"signals length ({len(signals)}) must match data length ({len(data)})"
+            )
 
-        # close remaining positions
-        if self.portfolio.has_position(symbol):
-            final_price = data.iloc[-1]['close']
-            final_date = data.index[-1]
-            self._process_sell_signal(symbol, final_date, final_price)
+        sig = np.nan_to_num(np.asarray(signals, dtype=np.float64)).astype(np.int8)
+
+        if self.engine == 'numba':
+            self._run_numba(symbol, closes, dates, sig)
+        else:
+            self._run_python(symbol, closes, dates, sig)
 
         returns = self.portfolio.get_returns()
-        metrics = calculate_all_metrics(returns) if len(returns) > 0 else {}
+        metrics = calculate_all_metrics(returns.to_numpy()) if len(returns) > 0 else {}
 
         result = BacktestResult(
             strategy_name=strategy.name,
@@ -92,24 +235,122 @@ class Backtester:
             final_capital=self.portfolio.total_value,
             equity_curve=self.portfolio.get_equity_curve(),
             trades=self.trades,
-            metrics=metrics
+            metrics=metrics,
+            trade_arrays=self.trade_arrays
         )
 
         return result
 
+    def _run_numba(
+        self,
+        symbol: str,
+        closes: np.ndarray,
+        dates: pd.DatetimeIndex,
+        sig: np.ndarray
+    ):
+        # run the compiled event loop and rebuild portfolio history and trades
+        (
+            cash_history, position_value_history,
+            entry_idx, exit_idx, trade_shares,
+            entry_prices, exit_prices, entry_comms, exit_comms,
+            final_cash
+        ) = _run_core(
+            closes, sig, float(self.initial_capital), float(self.commission_pct),
+            float(self.slippage_pct), float(self.position_size_pct)
+        )
+
+        self.portfolio.set_history(dates, cash_history, position_value_history)
+        self.portfolio.cash = final_cash
+
+        self.trade_arrays = {
+            'is_long': np.ones(len(entry_idx), dtype=bool),
+            'shares': trade_shares,
+            'entry_price': entry_prices,
+            'exit_price': exit_prices,
+            'entry_commission': entry_comms,
+            'exit_commission': exit_comms,
+            'entry_dates': dates[entry_idx],
+            'exit_dates': dates[exit_idx]
+        }
+        self.trades = [
+            Trade(
+                symbol=symbol,
+                entry_date=dates[entry_idx[k]],
+                entry_price=float(entry_prices[k]),
+                exit_date=dates[exit_idx[k]],
+                exit_price=float(exit_prices[k]),
+                shares=int(trade_shares[k]),
+                side='long',
+                entry_commission=float(entry_comms[k]),
+                exit_commission=float(exit_comms[k])
+            )
+            for k in range(len(entry_idx))
+        ]
+
+    def _run_python(
+        self,
+        symbol: str,
+        closes: np.ndarray,
+        dates: pd.DatetimeIndex,
+        sig: np.ndarray
+    ):
+        # reference event loop, only visits signals that can change the position
+        # while flat only buys matter and while holding only sells do, so the loop
+        # jumps straight to the next relevant signal instead of every nonzero bar
+        buys = np.flatnonzero(sig == 1)
+        sells = np.flatnonzero(sig == -1)
+
+        # portfolio state only changes on fills, checkpoint it there and expand
+        # the equity curve with numpy once the loop is done
+        self.portfolio.checkpoint(0, symbol)
+        pos = 0
+
+        while True:
+            pending = sells if self.portfolio.has_position(symbol) else buys
+            j = np.searchsorted(pending, pos)
+            if j == len(pending):
+                break
+
+            i = int(pending[j])
+            date = dates[i]
+            current_price = float(closes[i])
+
+            if sig[i] == 1:
+                self._process_buy_signal(symbol, date, current_price)
+            else:
+                self._process_sell_signal(symbol, date, current_price)
+
+            self.portfolio.checkpoint(i, symbol)
+            pos = i + 1
+
+        self.portfolio.build_history(dates, closes)
+
+        # close remaining positions
+        if self.portfolio.has_position(symbol):
+            final_price = float(closes[-1])
+            final_date = dates[-1]
+            self._process_sell_signal(symbol, final_date, final_price)
+
     def _process_buy_signal(self, symbol: str, date: pd.Timestamp, price: float):
         # process buy signal
-        if self.portfolio.has_position(symbol):
+        position = self.portfolio.positions.get(symbol)
+        if position is not None and position.shares > 0:
             return
 
-        execution_price = self.apply_slippage(price, 'buy')
+        # same math as apply_slippage, calculate_shares and calculate_commission
+        # inlined with locals to skip three method calls per signal
+        commission_pct = self.commission_pct
+        execution_price = price * (1 + self.slippage_pct)
         available_capital = self.portfolio.cash * self.position_size_pct
-        shares = self.calculate_shares(execution_price, available_capital)
 
+        if execution_price <= 0 or available_capital <= 0:
+            return
+
+        shares = int(available_capital / (execution_price * (1 + commission_pct)))
         if shares <= 0:
             return
 
-        commission = self.calculate_commission(shares, execution_price)
+        commission = shares * execution_price * commission_pct
         success = self.portfolio.buy(
             symbol=symbol,
             shares=shares,
@@ -133,13 +374,14 @@ class Backtester:
         price: float
     ):
         # process sell signal
-        if not self.portfolio.has_position(symbol):
+        position = self.portfolio.positions.get(symbol)
+        if position is None or position.shares <= 0:
             return
 
-        execution_price = self.apply_slippage(price, 'sell')
-        position = self.portfolio.get_position(symbol)
+        # inlined apply_slippage and calculate_commission, see buy side
+        execution_price = price * (1 - self.slippage_pct)
         shares = position.shares
-        commission = self.calculate_commission(shares, execution_price)
+        commission = shares * execution_price * self.commission_pct
 
         realized_pnl = self.portfolio.sell(
             symbol=symbol,
@@ -165,16 +407,126 @@ class Backtester:
             self.trades.append(trade)
             del self.open_trade_entry[symbol]
 
+    def _params(self) -> dict:
+        # constructor arguments for rebuilding this backtester in a worker
+        return {
+            'initial_capital': self.initial_capital,
+            'commission_pct': self.commission_pct,
+            'slippage_pct': self.slippage_pct,
+            'position_size_pct': self.position_size_pct,
+            'engine': self.engine
+        }
+
+    def _executor_cls(
+        self,
+        strategies: list[Strategy],
+        n_jobs: int,
+        n_bars: int,
+        max_workers: Optional[int] = None
+    ) -> tuple[Optional[type], int]:
+        # pick an executor and worker count for n_jobs independent backtests
+        # none means run in this process, unpicklable strategies fall back to threads
+        # without an explicit max_workers small workloads also stay in this process
+        if max_workers is None:
+            if n_bars * n_jobs < _PARALLEL_MIN_WORK:
+                return None, 1
+            max_workers = os.cpu_count() or 1
+        if max_workers == 1 or n_jobs <= 1:
+            return None, 1
+
+        try:
+            pickle.dumps(strategies)
+            executor_cls = ProcessPoolExecutor
+        except (pickle.PicklingError, AttributeError, TypeError):
+            executor_cls = ThreadPoolExecutor
+
+        return executor_cls, min(max_workers, n_jobs)
+
+    def _run_jobs(
+        self,
+        jobs: list[tuple[Strategy, pd.DataFrame, Optional[str], Optional[np.ndarray]]],
+        max_workers: Optional[int] = None,
+        process_runner=None
+    ) -> list[BacktestResult]:
+        # run independent (strategy, data, symbol, signals) jobs across cpu cores
+        # results come back in job order, max_workers=1 runs in this process
+        # process_runner(workers), when given, replaces the generic process pool run
+        n_bars = max((len(job[1]) for job in jobs), default=0)
+        executor_cls, workers = self._executor_cls(
+            [job[0] for job in jobs], len(jobs), n_bars, max_workers
+        )
+        if executor_cls is None:
+            return [
+                self.run(strategy, data, symbol, signals=signals)
+                for strategy, data, symbol, signals in jobs
+            ]
+
+        if executor_cls is ProcessPoolExecutor:
+            try:
+                if process_runner is not None:
+                    return process_runner(workers)
+                return self._submit_jobs(ProcessPoolExecutor, workers, jobs)
+            except _POOL_ERRORS:
+                # jobs that pickle here can still fail to load in a worker
+                executor_cls = ThreadPoolExecutor
+
+        return self._submit_jobs(executor_cls, workers, jobs)
+
+    def _submit_jobs(
+        self,
+        executor_cls: type,
+        workers: int,
+        jobs: list[tuple[Strategy, pd.DataFrame, Optional[str], Optional[np.ndarray]]]
+    ) -> list[BacktestResult]:
+        # run jobs on a fresh executor and collect results in job order
+        params = self._params()
+        with executor_cls(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_run_one, params, *job)
+                for job in jobs
+            ]
+            return [future.result() for future in futures]
+
+    def _run_shared_windows(
+        self,
+        strategy: Strategy,
+        data: pd.DataFrame,
+        windows: list[tuple[int, int]],
+        all_signals: np.ndarray,
+        symbol: Optional[str],
+        workers: int
+    ) -> list[BacktestResult]:
+        # run precomputed-signal windows in worker processes without pickling data
+        # the close column is written once to a memory-mapped file that each worker
+        # maps read-only, so a window only ships its offsets, dates and signals
+        params = self._params()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            close_path = os.path.join(tmp_dir, 'close.npy')
+            np.save(close_path, data['close'].to_numpy(dtype=np.float64))
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        _run_shared_window, params, strategy, close_path,
+                        start, end, data.index[start:end], symbol, all_signals[start:end]
+                    )
+                    for start, end in windows
+                ]
+                return [future.result() for future in futures]
+
     def run_multiple(
         self,
         strategies: list[Strategy],
         data: pd.DataFrame,
-        symbol: Optional[str] = None
+        symbol: Optional[str] = None,
+        max_workers: Optional[int] = None
     ) -> dict[str, BacktestResult]:
-        # run backtest for multiple strategies
+        # run backtest for multiple strategies in parallel
+        # max_workers: number of worker processes, none runs in this process below
+        # _PARALLEL_MIN_WORK bars x jobs and uses every cpu above it
+        jobs = [(strategy, data, symbol, None) for strategy in strategies]
         results = {}
-        for strategy in strategies:
-            result = self.run(strategy, data, symbol)
+        for strategy, result in zip(strategies, self._run_jobs(jobs, max_workers)):
             results[strategy.name] = result
         return results
 
@@ -185,23 +537,51 @@ class Backtester:
         train_size: int = 252,
         test_size: int = 63,
         step_size: int = 63,
-        symbol: Optional[str] = None
+        symbol: Optional[str] = None,
+        max_workers: Optional[int] = None
     ) -> list[BacktestResult]:
-        # split data into rolling windows and backtest on each
-        results = []
+        # split data into rolling windows and backtest each window in parallel
+        # max_workers: number of worker processes, none runs in this process below
+        # _PARALLEL_MIN_WORK bars x jobs and uses every cpu above it
+        # causal strategies get signals computed once over the full series and
+        # sliced per window, others regenerate signals on each window
+        all_signals = None
+        if strategy.is_causal:
+            all_signals = (
+                strategy.generate_signals(data)
+                .reindex(data.index)
+                .to_numpy(dtype=np.float64)
+            )
+
+        windows = []
         start_idx = 0
 
         while start_idx + train_size + test_size <= len(data):
             train_end = start_idx + train_size
             test_end = train_end + test_size
-            test_data = data.iloc[train_end:test_end]
-
-            result = self.run(strategy, test_data, symbol)
-            results.append(result)
+            windows.append((train_end, test_end))
 
             start_idx += step_size
 
-        return results
+        jobs = [
+            (
+                strategy,
+                data.iloc[start:end],
+                symbol,
+                all_signals[start:end] if all_signals is not None else None
+            )
+            for start, end in windows
+        ]
+
+        # with precomputed signals process workers map the close column once
+        # instead of receiving a pickled slice of data per window
+        process_runner = None
+        if all_signals is not None:
+            process_runner = functools.partial(
+                self._run_shared_windows, strategy, data, windows, all_signals, symbol
+            )
+
+        return self._run_jobs(jobs, max_workers, process_runner)
 
 # fetch data and run backtest in one call
 def quick_backtest(
@@ -1,10 +1,11 @@
 # portfolio management for positions, cash, and equity
 
+import numpy as np
 import pandas as pd
 from typing import Dict, Optional
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     # represents a position in the portfolio
     symbol: str
@@ -37,8 +38,15 @@ class Portfolio:
     def __init__(self, initial_cash: float = 100000):
         # initialize with starting cash balance
         self.initial_cash = initial_cash
-        self.cash = initial_cash
         self.positions: Dict[str, Position] = {}
+        self.reset()
+
+    def reset(self):
+        # clear cash, positions and history in place so the portfolio can be reused
+        self.cash = self.initial_cash
+        self.positions.clear()
+        self._cost_basis_total = 0.0
+        self._checkpoints = []
 
         self.equity_history = []
         self.cash_history = []
@@ -47,8 +55,8 @@ class Portfolio:
 
     @property
     def position_value(self) -> float:
-        # total value of all positions at cost basis
-        return sum(pos.cost_basis for pos in self.positions.values())
+        # total value of all positions at cost basis, kept as a running total
+        return self._cost_basis_total
 
     @property
     def total_value(self) -> float:
@@ -57,15 +65,26 @@ class Portfolio:
 
     def get_total_value(self, current_prices: Dict[str, float]) -> float:
         # total portfolio value using current prices
-        position_value = sum(
+        return self.cash + self._market_value(current_prices)
+
+    def _market_value(self, current_prices: Dict[str, float]) -> float:
+        # value of all positions at current prices, entry price if no quote
+        # single-symbol backtests hold at most one position, skip the generator
+        if not self.positions:
+            return 0.0
+        if len(self.positions) == 1:
+            pos = next(iter(self.positions.values()))
+            return pos.current_value(current_prices.get(pos.symbol, pos.entry_price))
+
+        return sum(
             pos.current_value(current_prices.get(pos.symbol, pos.entry_price))
             for pos in self.positions.values()
         )
-        return self.cash + position_value
 
     def has_position(self, symbol: str) -> bool:
         # check if position exists and has shares
-        return symbol in self.positions and self.positions[symbol].shares > 0
+        position = self.positions.get(symbol)
+        return position is not None and position.shares > 0
 
     def get_position(self, symbol: str) -> Optional[Position]:
         # get position or none if not exists
@@ -86,19 +105,16 @@ class Portfolio:
             return False
 
         self.cash -= cost
+        self._cost_basis_total += shares * price
 
-        if symbol in self.positions:
-            existing = self.positions[symbol]
+        existing = self.positions.get(symbol)
+        if existing is not None:
+            # update in place, entry date stays at the first fill
             total_shares = existing.shares + shares
             total_cost = existing.cost_basis + (shares * price)
-            avg_price = total_cost / total_shares
 
-            self.positions[symbol] = Position(
-                symbol=symbol,
-                shares=total_shares,
-                entry_price=avg_price,
-                entry_date=existing.entry_date
-            )
+            existing.entry_price = total_cost / total_shares
+            existing.shares = total_shares
         else:
             self.positions[symbol] = Position(
                 symbol=symbol,
@@ -118,10 +134,10 @@ class Portfolio:
         commission: float = 0.0
     ) -> Optional[float]:
         # sell shares, close or reduce position
-        if not self.has_position(symbol):
+        position = self.positions.get(symbol)
+        if position is None or position.shares <= 0:
             return None
 
-        position = self.positions[symbol]
         shares_to_sell = shares if shares is not None else position.shares
         shares_to_sell = min(shares_to_sell, position.shares)
 
@@ -134,21 +150,19 @@ class Portfolio:
         if shares_to_sell >= position.shares:
             del self.positions[symbol]
         else:
-            self.positions[symbol] = Position(
-                symbol=symbol,
-                shares=position.shares - shares_to_sell,
-                entry_price=position.entry_price,
-                entry_date=position.entry_date
-            )
+            position.shares -= shares_to_sell
+
+        # reset when flat so float drift from partial fills cannot accumulate
+        if self.positions:
+            self._cost_basis_total -= cost_basis_sold
+        else:
+            self._cost_basis_total = 0.0
 
         return realized_pnl
 
     def update_history(self, date: pd.Timestamp, current_prices: Dict[str, float]):
         # record current portfolio state in history
-        position_value = sum(
-            pos.current_value(current_prices.get(pos.symbol, pos.entry_price))
-            for pos in self.positions.values()
-        )
+        position_value = self._market_value(current_prices)
 
         total_value = self.cash + position_value
 
@@ -157,17 +171,63 @@ class Portfolio:
         self.cash_history.append(self.cash)
         self.position_value_history.append(position_value)
 
+    def checkpoint(self, i: int, symbol: str):
+        # mark bar i as the start of a span where cash and shares stay constant
+        # symbol: position marked to market, other positions stay at cost basis
+        # no-op when nothing changed since the previous checkpoint
+        position = self.positions.get(symbol)
+        shares = position.shares if position is not None else 0.0
+        other_value = sum(
+            pos.cost_basis for pos in self.positions.values() if pos.symbol != symbol
+        )
+        state = (self.cash, shares, other_value)
+
+        if self._checkpoints and self._checkpoints[-1][1:] == state:
+            return
+        self._checkpoints.append((i, *state))
+
+    def build_history(self, dates: pd.DatetimeIndex, prices: np.ndarray):
+        # expand checkpoints into dense history arrays over all bars
+        # prices: close prices of the checkpoint symbol aligned with dates
+        prices = np.asarray(prices, dtype=np.float64)
+        cash = np.empty(len(dates))
+        position_value = np.empty(len(dates))
+
+        ends = [cp[0] for cp in self._checkpoints[1:]] + [len(dates)]
+        for (start, cp_cash, shares, other_value), end in zip(self._checkpoints, ends):
+            cash[start:end] = cp_cash
+            position_value[start:end] = shares * prices[start:end] + other_value
+
+        self.set_history(dates, cash, position_value)
+
+    def set_history(
+        self,
+        dates: pd.DatetimeIndex,
+        cash: np.ndarray,
+        position_value: np.ndarray
+    ):
+        # replace history with precomputed per-bar cash and position value arrays
+        self.dates = dates
+        self.cash_history = cash
+        self.position_value_history = position_value
+        self.equity_history = cash + position_value
+
     def get_equity_curve(self) -> pd.Series:
         # get equity curve as pandas series with dates as index
-        if not self.dates:
+        if len(self.dates) == 0:
             return pd.Series(dtype=float)
 
         return pd.Series(self.equity_history, index=self.dates, name='equity')
 
     def get_returns(self) -> pd.Series:
         # calculate period-over-period returns from equity curve
-        equity = self.get_equity_curve()
-        return equity.pct_change().dropna()
+        equity = np.asarray(self.equity_history, dtype=np.float64)
+        if len(equity) < 2:
+            return pd.Series(dtype=float, name='returns')
+
+        returns = equity[1:] / equity[:-1] - 1.0
+        valid = ~np.isnan(returns)
+        return pd.Series(returns[valid], index=pd.Index(self.dates[1:])[valid], name='returns')
 
     def get_summary(self, current_prices: Dict[str, float]) -> dict:
         # get portfolio summary statistics
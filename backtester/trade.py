@@ -1,10 +1,11 @@
 # trade representation and tracking
 
+import numpy as np
 import pandas as pd
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     # represents a completed round-trip trade
     symbol: str
@@ -17,33 +18,50 @@ class Trade:
     entry_commission: float = 0.0
     exit_commission: float = 0.0
 
+    # derived values memoized on first access, trade fields are fixed after creation
+    # slots rule out functools.cached_property so the cache lives in private fields
+    _holding_period: Optional[pd.Timedelta] = field(default=None, init=False, repr=False, compare=False)
+    _entry_value: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _exit_value: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _gross_pnl: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _net_pnl: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def holding_period(self) -> pd.Timedelta:
         # time between entry and exit
-        return self.exit_date - self.entry_date
+        if self._holding_period is None:
+            self._holding_period = self.exit_date - self.entry_date
+        return self._holding_period
 
     @property
     def holding_days(self) -> int:
-        # holding period in days
-        return self.holding_period.days
+        # holding period in days, raw difference for non-datetime bars
+        held = self.holding_period
+        return held.days if isinstance(held, pd.Timedelta) else held
 
     @property
     def entry_value(self) -> float:
         # total cost of entry with commission
-        return self.shares * self.entry_price + self.entry_commission
+        if self._entry_value is None:
+            self._entry_value = self.shares * self.entry_price + self.entry_commission
+        return self._entry_value
 
     @property
     def exit_value(self) -> float:
         # total proceeds from exit minus commission
-        return self.shares * self.exit_price - self.exit_commission
+        if self._exit_value is None:
+            self._exit_value = self.shares * self.exit_price - self.exit_commission
+        return self._exit_value
 
     @property
     def gross_pnl(self) -> float:
         # profit/loss before commissions
-        if self.side == 'long':
-            return self.shares * (self.exit_price - self.entry_price)
-        else:
-            return self.shares * (self.entry_price - self.exit_price)
+        if self._gross_pnl is None:
+            if self.side == 'long':
+                self._gross_pnl = self.shares * (self.exit_price - self.entry_price)
+            else:
+                self._gross_pnl = self.shares * (self.entry_price - self.exit_price)
+        return self._gross_pnl
 
     @property
     def commission_paid(self) -> float:
@@ -53,7 +71,9 @@ class Trade:
     @property
     def net_pnl(self) -> float:
         # profit/loss after commissions
-        return self.gross_pnl - self.commission_paid
+        if self._net_pnl is None:
+            self._net_pnl = self.gross_pnl - self.commission_paid
+        return self._net_pnl
 
     @property
     def return_pct(self) -> float:
@@ -95,7 +115,7 @@ class Trade:
             f"P&L: ${self.net_pnl:,.2f} ({self.return_pct:.2%}))"
         )
 
-@dataclass
+@dataclass(slots=True)
 class BacktestResult:
     # results from a backtest run
     strategy_name: str
@@ -107,6 +127,71 @@ class BacktestResult:
     equity_curve: pd.Series
     trades: list[Trade]
     metrics: dict
+    trade_arrays: Optional[dict] = field(default=None, repr=False, compare=False)
+    _stats: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._init_arrays()
+
+    def _init_arrays(self):
+        # struct-of-arrays store of the trades, aggregate properties read from it
+        # trade_arrays can be passed in by the engine, otherwise built from trades
+        # trades are treated as fixed once the result is created
+        if self.trade_arrays is None:
+            n = len(self.trades)
+            # integer share counts stay int64, as a dataframe of the trades would infer
+            integral = all(
+                isinstance(t.shares, (int, np.integer)) and not isinstance(t.shares, bool)
+                for t in self.trades
+            )
+            self.trade_arrays = {
+                'is_long': np.fromiter((t.side == 'long' for t in self.trades), dtype=bool, count=n),
+                'shares': np.fromiter(
+                    (t.shares for t in self.trades),
+                    dtype=np.int64 if integral else np.float64,
+                    count=n
+                ),
+                'entry_price': np.fromiter((t.entry_price for t in self.trades), dtype=np.float64, count=n),
+                'exit_price': np.fromiter((t.exit_price for t in self.trades), dtype=np.float64, count=n),
+                'entry_commission': np.fromiter((t.entry_commission for t in self.trades), dtype=np.float64, count=n),
+                'exit_commission': np.fromiter((t.exit_commission for t in self.trades), dtype=np.float64, count=n),
+                'entry_dates': pd.Index([t.entry_date for t in self.trades]),
+                'exit_dates': pd.Index([t.exit_date for t in self.trades])
+            }
+
+        arrays = self.trade_arrays
+        shares = arrays['shares']
+        entry_price = arrays['entry_price']
+        exit_price = arrays['exit_price']
+
+        gross = np.where(
+            arrays['is_long'],
+            shares * (exit_price - entry_price),
+            shares * (entry_price - exit_price)
+        )
+        commission = arrays['entry_commission'] + arrays['exit_commission']
+        net = gross - commission
+
+        self._stats = {
+            **arrays,
+            'gross_pnl': gross,
+            'commission_paid': commission,
+            'net_pnl': net,
+            'wins': net > 0
+        }
+
+    def _holding_days(self) -> np.ndarray:
+        # holding periods computed on first use, timedelta differences give days
+        # and other indexes (e.g. integer bars) keep the raw difference
+        if 'holding_days' not in self._stats:
+            try:
+                held = self._stats['exit_dates'] - self._stats['entry_dates']
+            except TypeError:
+                held = np.full(len(self.trades), np.nan)
+            if isinstance(held, pd.TimedeltaIndex):
+                held = held.days
+            self._stats['holding_days'] = np.asarray(held)
+        return self._stats['holding_days']
 
     @property
     def total_return(self) -> float:
@@ -126,22 +211,24 @@ class BacktestResult:
     @property
     def winning_trades(self) -> list[Trade]:
         # list of winning trades
-        return [t for t in self.trades if t.is_winner]
+        wins = self._stats['wins']
+        return [t for t, win in zip(self.trades, wins) if win]
 
     @property
     def losing_trades(self) -> list[Trade]:
         # list of losing trades
-        return [t for t in self.trades if not t.is_winner]
+        wins = self._stats['wins']
+        return [t for t, win in zip(self.trades, wins) if not win]
 
     @property
     def num_winners(self) -> int:
         # number of winning trades
-        return len(self.winning_trades)
+        return int(self._stats['wins'].sum())
 
     @property
     def num_losers(self) -> int:
         # number of losing trades
-        return len(self.losing_trades)
+        return self.num_trades - self.num_winners
 
     @property
     def win_rate(self) -> float:
@@ -153,22 +240,27 @@ class BacktestResult:
     @property
     def avg_win(self) -> float:
         # average profit from winning trades
-        if not self.winning_trades:
+        stats = self._stats
+        win_pnl = stats['net_pnl'][stats['wins']]
+        if len(win_pnl) == 0:
             return 0.0
-        return sum(t.net_pnl for t in self.winning_trades) / len(self.winning_trades)
+        return float(win_pnl.mean())
 
     @property
     def avg_loss(self) -> float:
         # average loss from losing trades
-        if not self.losing_trades:
+        stats = self._stats
+        loss_pnl = stats['net_pnl'][~stats['wins']]
+        if len(loss_pnl) == 0:
             return 0.0
-        return sum(t.net_pnl for t in self.losing_trades) / len(self.losing_trades)
+        return float(loss_pnl.mean())
 
     @property
     def profit_factor(self) -> float:
         # profit factor ratio
-        gross_wins = sum(t.net_pnl for t in self.winning_trades)
-        gross_losses = abs(sum(t.net_pnl for t in self.losing_trades))
+        stats = self._stats
+        gross_wins = float(stats['net_pnl'][stats['wins']].sum())
+        gross_losses = abs(float(stats['net_pnl'][~stats['wins']].sum()))
 
         if gross_losses == 0:
             return float('inf') if gross_wins > 0 else 0.0
@@ -180,14 +272,39 @@ class BacktestResult:
         # average holding period in days
         if not self.trades:
             return 0.0
-        return sum(t.holding_days for t in self.trades) / len(self.trades)
+        return float(self._holding_days().mean())
 
     def get_trades_df(self) -> pd.DataFrame:
         # get trades as dataframe with one row per trade
         if not self.trades:
             return pd.DataFrame()
 
-        return pd.DataFrame([t.to_dict() for t in self.trades])
+        # assemble columns from the cached arrays instead of one dict per trade
+        stats = self._stats
+        entry_value = stats['shares'] * stats['entry_price'] + stats['entry_commission']
+        exit_value = stats['shares'] * stats['exit_price'] - stats['exit_commission']
+        return_pct = np.divide(
+            stats['net_pnl'], entry_value,
+            out=np.zeros_like(entry_value), where=entry_value != 0
+        )
+
+        return pd.DataFrame({
+            'symbol': [t.symbol for t in self.trades],
+            'side': [t.side for t in self.trades],
+            'entry_date': stats['entry_dates'],
+            'entry_price': stats['entry_price'],
+            'exit_date': stats['exit_dates'],
+            'exit_price': stats['exit_price'],
+            'shares': stats['shares'],
+            'holding_days': self._holding_days(),
+            'entry_value': entry_value,
+            'exit_value': exit_value,
+            'gross_pnl': stats['gross_pnl'],
+            'commission_paid': stats['commission_paid'],
+            'net_pnl': stats['net_pnl'],
+            'return_pct': return_pct,
+            'is_winner': stats['wins']
+        })
 
     def print_summary(self):
         # print formatted summary of backtest results
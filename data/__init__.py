@@ -14,6 +14,7 @@ from .preprocessing import (
     create_features,
     validate_ohlc_logic
 )
+from .rolling import rolling_mean, rolling_std
 
 __all__ = [
     # base
@@ -33,5 +34,9 @@ __all__ = [
     'align_data',
     'split_train_test',
     'create_features',
-    'validate_ohlc_logic'
+    'validate_ohlc_logic',
+
+    # rolling kernels
+    'rolling_mean',
+    'rolling_std'
 ]
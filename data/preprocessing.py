@@ -1,15 +1,39 @@
 # data preprocessing and cleaning utilities
 
+from functools import reduce
 import pandas as pd
 import numpy as np
+from numba import njit
+from .rolling import rolling_mean, rolling_std
+
+
+@njit(cache=True)
+def _mean_std(values: np.ndarray) -> tuple:
+    # mean and sample std in one welford pass, skipping nan like pandas
+    # std is nan with fewer than two observations
+    n = 0
+    mean = 0.0
+    ssqdm = 0.0
+    for x in values:
+        if not np.isnan(x):
+            n += 1
+            delta = x - mean
+            mean += delta / n
+            ssqdm += delta * (x - mean)
+
+    if n == 0:
+        return np.nan, np.nan
+    if n == 1:
+        return mean, np.nan
+    return mean, np.sqrt(ssqdm / (n - 1))
+
 
 def handle_missing_data(
     data: pd.DataFrame,
     method: str = 'ffill'
 ) -> pd.DataFrame:
     # handle missing data with forward fill, drop, or interpolation
-    data = data.copy()
-
+    # every method returns a new frame so no defensive copy is needed
     if method == 'ffill':
         data = data.ffill()
     elif method == 'drop':
@@ -28,57 +52,95 @@ def remove_outliers(
     n_std: float = 5.0
 ) -> pd.DataFrame:
     # remove outliers based on standard deviation
-    data = data.copy()
-
-    mean = data[column].mean()
-    std = data[column].std()
+    # boolean indexing returns a new frame, only the early return copies
+    values = data[column].to_numpy(dtype=np.float64)
+    mean, std = _mean_std(values)
 
     if std == 0:
-        return data
+        return data.copy()
 
-    z_scores = np.abs((data[column] - mean) / std)
-    data = data[z_scores < n_std]
+    # nan values and a nan std compare false, dropping those rows as before
+    data = data[np.abs(values - mean) < n_std * std]
 
     return data
 
 
+def _period_ratios(close: np.ndarray, periods: list, offset: float = 0.0) -> np.ndarray:
+    # price ratios close[t] / close[t - period] - offset, one contiguous row per
+    # period, nan for the first period bars and wherever either close is nan
+    n = len(close)
+    ratios = np.empty((len(periods), n))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for k, period in enumerate(periods):
+            period = min(period, n)
+            row = ratios[k]
+            row[:period] = np.nan
+            np.divide(close[period:], close[:n - period], out=row[period:])
+            if offset:
+                np.subtract(row[period:], offset, out=row[period:])
+
+    return ratios
+
+
 def add_returns(
     data: pd.DataFrame,
-    periods: list = [1]
+    periods: list = [1],
+    *,
+    copy: bool = True
 ) -> pd.DataFrame:
     # add return columns to dataframe
-    data = data.copy()
+    # copy=False adds the columns to data itself, for callers that own the frame
+    # nan gaps in close are not forward-filled: bars at or one period after a
+    # missing close are nan, like pct_change(fill_method=None), the pandas 3
+    # default (pandas 2 pct_change() filled gaps with the previous close)
+    if copy:
+        data = data.copy()
 
-    for period in periods:
+    returns = _period_ratios(data['close'].to_numpy(dtype=np.float64), periods, offset=1.0)
+
+    for k, period in enumerate(periods):
         col_name = f'returns_{period}d' if period != 1 else 'returns'
-        data[col_name] = data['close'].pct_change(periods=period)
+        data[col_name] = returns[k]
 
     return data
 
 
 def add_log_returns(
     data: pd.DataFrame,
-    periods: list = [1]
+    periods: list = [1],
+    *,
+    copy: bool = True
 ) -> pd.DataFrame:
     # add log return columns (additive returns)
-    data = data.copy()
+    if copy:
+        data = data.copy()
+
+    log_returns = _period_ratios(data['close'].to_numpy(dtype=np.float64), periods)
+    # log only positive finite ratios in place, the rest (0, negative, inf from
+    # division by zero, nan) become nan without a separate replace scan
+    valid = (log_returns > 0) & (log_returns < np.inf)
+    np.log(log_returns, out=log_returns, where=valid)
+    log_returns[~valid] = np.nan
 
-    for period in periods:
+    for k, period in enumerate(periods):
         col_name = f'log_returns_{period}d' if period != 1 else 'log_returns'
-        price_ratio = data['close'] / data['close'].shift(period)
-        # replace 0, inf, -inf with nan to avoid log(0) and division by zero
-        price_ratio = price_ratio.replace([0, np.inf, -np.inf], np.nan)
-        data[col_name] = np.log(price_ratio)
+        data[col_name] = log_returns[k]
 
     return data
 
 
-def normalize_volume(data: pd.DataFrame) -> pd.DataFrame:
+def normalize_volume(data: pd.DataFrame, *, copy: bool = True) -> pd.DataFrame:
     # normalize volume using 20-day rolling average
-    data = data.copy()
-    avg_volume = data['volume'].rolling(window=20).mean()
+    if copy:
+        data = data.copy()
+    volume = data['volume'].to_numpy(dtype=np.float64)
+
+    # o(n) running-sum window kernel, bit-identical to rolling(20).mean()
+    avg_volume = rolling_mean(volume, 20)
+
     # replace 0 with nan to avoid division by zero
-    data['normalized_volume'] = data['volume'] / avg_volume.replace(0, np.nan)
+    data['normalized_volume'] = volume / np.where(avg_volume == 0, np.nan, avg_volume)
 
     return data
 
@@ -91,15 +153,37 @@ def resample_data(
     if not isinstance(data.index, pd.DatetimeIndex):
         raise ValueError("data must have datetimeindex for resampling")
 
-    resampled = data.resample(freq).agg({
-        'open': 'first',
-        'high': 'max',
-        'low': 'min',
-        'close': 'last',
-        'volume': 'sum'
-    })
-
-    resampled = resampled.dropna()
+    columns = ['open', 'high', 'low', 'close', 'volume']
+    ordered = data.index.is_monotonic_increasing
+    if not ordered or data[columns].isna().to_numpy().any():
+        # nan-skipping first/last and unordered bins need the pandas aggregations
+        resampled = data.resample(freq).agg({
+            'open': 'first',
+            'high': 'max',
+            'low': 'min',
+            'close': 'last',
+            'volume': 'sum'
+        })
+
+        resampled = resampled.dropna()
+
+        return resampled
+
+    # sorted clean data: pandas only places the bins, each bin is then a
+    # contiguous run of rows reduced with reduceat in one pass per column
+    # empty bins have no start row and are dropped like the nan rows above
+    starts = pd.Series(np.arange(len(data)), index=data.index).resample(freq).min().dropna()
+    edges = starts.to_numpy(dtype=np.int64)
+    last_rows = np.append(edges[1:] - 1, len(data) - 1)
+
+    o, h, l, c, v = (data[k].to_numpy() for k in columns)
+    resampled = pd.DataFrame({
+        'open': o[edges],
+        'high': np.maximum.reduceat(h, edges),
+        'low': np.minimum.reduceat(l, edges),
+        'close': c[last_rows],
+        'volume': np.add.reduceat(v, edges)
+    }, index=starts.index)
 
     return resampled
 
@@ -114,11 +198,29 @@ def align_data(
 
     dfs = list(data_dict.values())
     symbols = list(data_dict.keys())
+    indexes = [df.index for df in dfs]
+
+    # naive datetime indexes are combined as raw datetime64 arrays, one numpy
+    # set operation per frame or a single sort, instead of folding pandas
+    # set ops that re-check order and rebuild an index at every step
+    as_arrays = all(
+        isinstance(index, pd.DatetimeIndex) and index.tz is None
+        for index in indexes
+    )
+    names = {index.name for index in indexes}
+    name = names.pop() if len(names) == 1 else None
 
     if method == 'inner':
-        common_index = dfs[0].index
-        for df in dfs[1:]:
-            common_index = common_index.intersection(df.index)
+        if as_arrays:
+            common = reduce(
+                lambda a, b: np.intersect1d(a, b, assume_unique=True),
+                [np.unique(index.values) for index in indexes]
+            )
+            common_index = pd.DatetimeIndex(common, name=name)
+        else:
+            common_index = indexes[0]
+            for index in indexes[1:]:
+                common_index = common_index.intersection(index)
 
         aligned = {
             symbol: data_dict[symbol].loc[common_index]
@@ -126,9 +228,15 @@ def align_data(
         }
 
     elif method == 'outer':
-        all_dates = dfs[0].index
-        for df in dfs[1:]:
-            all_dates = all_dates.union(df.index)
+        if as_arrays:
+            all_dates = pd.DatetimeIndex(
+                np.unique(np.concatenate([index.values for index in indexes])),
+                name=name
+            )
+        else:
+            all_dates = indexes[0]
+            for index in indexes[1:]:
+                all_dates = all_dates.union(index)
 
         aligned = {
             symbol: data_dict[symbol].reindex(all_dates)
@@ -156,30 +264,53 @@ def split_train_test(
 
 def create_features(data: pd.DataFrame) -> pd.DataFrame:
     # create common technical features: returns, moving averages, volatility
+    # one copy at the pipeline boundary, the stages below write into it
     data = data.copy()
 
-    data = add_returns(data, periods=[1, 5, 20])
+    data = add_returns(data, periods=[1, 5, 20], copy=False)
 
+    # rolling reductions from the numba window kernels, one contiguous pass
+    # per window over the raw column arrays
+    close = data['close'].to_numpy(dtype=np.float64)
     for period in [10, 20, 50, 200]:
-        data[f'sma_{period}'] = data['close'].rolling(window=period).mean()
+        data[f'sma_{period}'] = rolling_mean(close, period)
 
+    returns = data['returns'].to_numpy(dtype=np.float64)
     for period in [10, 20]:
-        data[f'volatility_{period}'] = data['returns'].rolling(window=period).std()
+        data[f'volatility_{period}'] = rolling_std(returns, period)
 
-    data = normalize_volume(data)
+    # replace 0 with nan to avoid division by zero
+    avg_volume = rolling_mean(data['volume'].to_numpy(dtype=np.float64), 20)
+    data['normalized_volume'] = data['volume'] / np.where(avg_volume == 0, np.nan, avg_volume)
     data['daily_range'] = (data['high'] - data['low']) / data['close']
     data['gap'] = (data['open'] - data['close'].shift(1)) / data['close'].shift(1)
 
     return data
 
 
-def validate_ohlc_logic(data: pd.DataFrame, fix: bool = False) -> pd.DataFrame:
+def validate_ohlc_logic(
+    data: pd.DataFrame,
+    fix: bool = False,
+    *,
+    copy: bool = True
+) -> pd.DataFrame:
     # validate ohlc logic and optionally fix invalid rows
-    data = data.copy()
-
-    invalid_high = (data['high'] < data['open']) | (data['high'] < data['close']) | (data['high'] < data['low'])
-    invalid_low = (data['low'] > data['open']) | (data['low'] > data['close']) | (data['low'] > data['high'])
-    invalid_volume = data['volume'] < 0
+    # copy=False fixes rows in data itself
+    if copy:
+        data = data.copy()
+
+    o, h, l, c, v = (
+        data[k].to_numpy(dtype=np.float64)
+        for k in ('open', 'high', 'low', 'close', 'volume')
+    )
+
+    # columnar ufunc passes instead of row-wise .loc reductions
+    # fmax/fmin skip nan like pandas max/min, so a nan bound never wins
+    bar_high = np.fmax(np.fmax(o, c), l)
+    bar_low = np.fmin(np.fmin(o, c), h)
+    invalid_high = h < bar_high
+    invalid_low = l > bar_low
+    invalid_volume = v < 0
 
     total_invalid = invalid_high.sum() + invalid_low.sum() + invalid_volume.sum()
 
@@ -190,9 +321,14 @@ def validate_ohlc_logic(data: pd.DataFrame, fix: bool = False) -> pd.DataFrame:
                 f"set fix=true to attempt correction"
             )
 
-        data.loc[invalid_high, 'high'] = data.loc[invalid_high, ['open', 'close', 'low']].max(axis=1)
-        data.loc[invalid_low, 'low'] = data.loc[invalid_low, ['open', 'close', 'high']].min(axis=1)
-        data.loc[invalid_volume, 'volume'] = 0
+        new_high = np.where(invalid_high, bar_high, h)
+        # low bound uses the corrected high
+        new_low = np.where(invalid_low, np.fmin(np.fmin(o, c), new_high), l)
+
+        # write back in the input dtype so float32 frames stay float32
+        data['high'] = new_high.astype(data['high'].dtype, copy=False)
+        data['low'] = new_low.astype(data['low'].dtype, copy=False)
+        data['volume'] = np.where(invalid_volume, 0, data['volume'].to_numpy())
 
         print(f"fixed {total_invalid} invalid rows")
 
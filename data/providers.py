@@ -1,6 +1,8 @@
 # data providers for fetching crypto market data
 
+from functools import lru_cache
 from typing import Optional
+import numpy as np
 import pandas as pd
 import ccxt
 from .base import DataProvider
@@ -21,47 +23,72 @@ class BinanceProvider(DataProvider):
         symbol: str,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        timeframe: str = '1d'
+        timeframe: str = '1d',
+        dtype: str = 'float64'
     ) -> pd.DataFrame:
         # fetch ohlcv data from binance
         # symbol: trading pair like 'BTC/USDT'
         # start_date: start date 'yyyy-mm-dd'
         # end_date: end date 'yyyy-mm-dd'
         # timeframe: '1m', '5m', '15m', '1h', '4h', '1d', '1w'
+        # dtype: 'float64' or 'float32' for the ohlcv columns, float32 halves
+        # memory for long histories, preprocessing and metrics still
+        # accumulate in float64
         # returns: dataframe with ohlcv columns and datetime index
+        if dtype not in ('float64', 'float32'):
+            raise ValueError(f"dtype must be 'float64' or 'float32', got {dtype}")
 
         try:
             # convert dates to timestamps if provided
             since = None
             if start_date:
                 since = self.exchange.parse8601(f"{start_date}T00:00:00Z")
-
-            # fetch ohlcv data
-            ohlcv = self.exchange.fetch_ohlcv(
-                symbol,
-                timeframe=timeframe,
-                since=since,
-                limit=1000  # max per request
-            )
-
-            if not ohlcv:
+            end_ms = None
+            if end_date:
+                end_ms = self.exchange.parse8601(f"{end_date}T00:00:00Z")
+
+            # page through the range, binance caps each request at limit candles
+            limit = 1000
+            timeframe_ms = self.exchange.parse_timeframe(timeframe) * 1000
+            rows = []
+            while True:
+                batch = self.exchange.fetch_ohlcv(
+                    symbol,
+                    timeframe=timeframe,
+                    since=since,
+                    limit=limit
+                )
+                if not batch:
+                    break
+
+                rows.extend(batch)
+
+                # a short page means the range is exhausted
+                since = batch[-1][0] + timeframe_ms
+                if len(batch) < limit or (end_ms is not None and since > end_ms):
+                    break
+
+            if not rows:
                 raise ValueError(f"no data retrieved for {symbol}")
 
-            # convert to dataframe
+            # convert to dataframe once from all pages
+            # fields are laid out one contiguous row each and wrapped without a
+            # copy, so every column the backtest reads is a unit-stride view
+            ohlcv = np.ascontiguousarray(np.asarray(rows, dtype=np.float64).T)
+            values = ohlcv[1:] if dtype == 'float64' else ohlcv[1:].astype(np.float32)
             data = pd.DataFrame(
-                ohlcv,
-                columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
+                values.T,
+                columns=['open', 'high', 'low', 'close', 'volume'],
+                index=pd.to_datetime(ohlcv[0].astype(np.int64), unit='ms'),
+                copy=False
             )
-
-            # convert timestamp to datetime
-            data['timestamp'] = pd.to_datetime(data['timestamp'], unit='ms')
-            data.set_index('timestamp', inplace=True)
             data.index.name = 'date'
 
-            # filter by end date if provided
+            # filter by end date if provided, candles are in time order so
+            # this is a positional slice rather than a boolean mask copy
             if end_date:
                 end_ts = pd.Timestamp(end_date)
-                data = data[data.index <= end_ts]
+                data = data.iloc[:data.index.searchsorted(end_ts, side='right')]
 
             # validate
             if not self.validate_data(data):
@@ -79,20 +106,32 @@ class BinanceProvider(DataProvider):
     def get_available_symbols(self) -> list:
         # get list of available trading pairs
         try:
+            # match the structured quote field instead of scanning symbol strings,
+            # markets flagged inactive (delisted) are skipped
             markets = self.exchange.load_markets()
-            return [symbol for symbol in markets.keys() if '/USDT' in symbol]
+            return [
+                symbol for symbol, market in markets.items()
+                if market.get('quote') == 'USDT' and market.get('active', True) is not False
+            ]
         except Exception as e:
             raise ValueError(f"failed to get symbols: {str(e)}")
 
 
+@lru_cache(maxsize=1)
+def _binance() -> BinanceProvider:
+    # shared provider so repeated fetches reuse one ccxt exchange and its
+    # http session instead of paying client setup and tls handshakes per call
+    return BinanceProvider()
+
+
 # convenience function for quick data fetching
 def fetch_crypto(
     symbol: str,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    timeframe: str = '1d'
+    timeframe: str = '1d',
+    dtype: str = 'float64'
 ) -> pd.DataFrame:
     # fetch crypto data from binance
     # simple wrapper for quick usage
-    provider = BinanceProvider()
-    return provider.fetch(symbol, start_date, end_date, timeframe)
+    return _binance().fetch(symbol, start_date, end_date, timeframe, dtype)
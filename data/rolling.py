@@ -0,0 +1,157 @@
+# numba rolling window kernels over raw float64 arrays
+# shared by preprocessing features and plots, results follow pandas rolling()
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    # rolling mean over one contiguous array, mirrors pandas rolling().mean():
+    # separate compensated sums for adds and removes, nan until the window
+    # holds that many observations, constant runs return the value itself
+    # and sign-consistent windows clamp
+    n = len(values)
+    out = np.empty(n)
+    total = 0.0
+    add_comp = 0.0
+    remove_comp = 0.0
+    nobs = 0
+    neg_ct = 0
+    same_ct = 0
+    prev = np.nan
+
+    for i in range(n):
+        if window == 1:
+            # non-overlapping windows restart from scratch like pandas
+            total = 0.0
+            add_comp = 0.0
+            remove_comp = 0.0
+            nobs = 0
+            neg_ct = 0
+            same_ct = 0
+            prev = np.nan
+        elif i >= window:
+            x = values[i - window]
+            if not np.isnan(x):
+                nobs -= 1
+                y = -x - remove_comp
+                t = total + y
+                remove_comp = t - total - y
+                total = t
+                if np.signbit(x):
+                    neg_ct -= 1
+
+        x = values[i]
+        if not np.isnan(x):
+            nobs += 1
+            y = x - add_comp
+            t = total + y
+            add_comp = t - total - y
+            total = t
+            if np.signbit(x):
+                neg_ct += 1
+            if x == prev:
+                same_ct += 1
+            else:
+                same_ct = 1
+            prev = x
+
+        if nobs >= window:
+            mean = total / nobs
+            if same_ct >= nobs:
+                mean = prev
+            elif neg_ct == 0 and mean < 0:
+                mean = 0.0
+            elif neg_ct == nobs and mean > 0:
+                mean = 0.0
+            out[i] = mean
+        else:
+            out[i] = np.nan
+
+    return out
+
+
+@njit(cache=True)
+def _rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    # rolling sample std (ddof=1) over one contiguous array like pandas
+    # rolling().std(): compensated welford adds and removes, nan until the
+    # window is full and below two observations, constant runs give 0
+    n = len(values)
+    out = np.empty(n)
+    mean = 0.0
+    ssqdm = 0.0
+    add_comp = 0.0
+    remove_comp = 0.0
+    nobs = 0
+    same_ct = 0
+    prev = np.nan
+
+    for i in range(n):
+        if window == 1:
+            # non-overlapping windows restart from scratch like pandas
+            mean = 0.0
+            ssqdm = 0.0
+            add_comp = 0.0
+            remove_comp = 0.0
+            nobs = 0
+            same_ct = 0
+            prev = np.nan
+        elif i >= window:
+            x = values[i - window]
+            if not np.isnan(x):
+                nobs -= 1
+                if nobs > 0:
+                    prev_mean = mean - remove_comp
+                    y = x - remove_comp
+                    t = y - mean
+                    remove_comp = t + mean - y
+                    mean -= t / nobs
+                    ssqdm -= (x - prev_mean) * (x - mean)
+                    if nobs == 1:
+                        # one observation left, the last one added: exact state
+                        # instead of the drift the removal leaves behind
+                        mean = prev
+                        ssqdm = 0.0
+                else:
+                    mean = 0.0
+                    ssqdm = 0.0
+
+        x = values[i]
+        if not np.isnan(x):
+            nobs += 1
+            if x == prev:
+                same_ct += 1
+            else:
+                same_ct = 1
+            prev = x
+            prev_mean = mean - add_comp
+            y = x - add_comp
+            t = y - mean
+            add_comp = t + mean - y
+            mean += t / nobs
+            ssqdm += (x - prev_mean) * (x - mean)
+
+        if nobs >= window and nobs > 1:
+            if same_ct >= nobs:
+                out[i] = 0.0
+            else:
+                out[i] = np.sqrt(max(ssqdm / (nobs - 1), 0.0))
+        else:
+            out[i] = np.nan
+
+    return out
+
+
+def rolling_mean(values, window: int) -> np.ndarray:
+    # rolling mean of a 1d array like pd.Series(values).rolling(window).mean()
+    if window <= 0:
+        raise ValueError("window must be positive")
+    return _rolling_mean(np.ascontiguousarray(values, dtype=np.float64), window)
+
+
+def rolling_std(values, window: int) -> np.ndarray:
+    # rolling sample std of a 1d array like pd.Series(values).rolling(window).std()
+    if window <= 0:
+        raise ValueError("window must be positive")
+    return _rolling_std(np.ascontiguousarray(values, dtype=np.float64), window)
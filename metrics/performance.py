@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+from numba import njit
 from typing import Union
 
 def calculate_returns(prices: pd.Series) -> pd.Series:
@@ -16,12 +17,13 @@ def calculate_sharpe_ratio(
     periods_per_year: int = 252
 ) -> float:
     # sharpe ratio measuring excess return per unit of risk
-    if returns.std() == 0:
+    # std is computed once, the excess mean is the mean shifted by the risk free rate
+    std = returns.std()
+    if std == 0:
         return 0.0
 
     period_risk_free_rate = risk_free_rate / periods_per_year
-    excess_returns = returns - period_risk_free_rate
-    sharpe = np.sqrt(periods_per_year) * excess_returns.mean() / returns.std()
+    sharpe = np.sqrt(periods_per_year) * (returns.mean() - period_risk_free_rate) / std
 
     return sharpe
 
@@ -31,24 +33,49 @@ def calculate_sortino_ratio(
     periods_per_year: int = 252
 ) -> float:
     # sortino ratio penalizing only downside volatility
+    # downside std from masked two-pass reductions instead of a filtered copy
     period_risk_free_rate = risk_free_rate / periods_per_year
-    excess_returns = returns - period_risk_free_rate
-    downside_returns = returns[returns < 0]
+    values = returns.to_numpy(dtype=np.float64)
+    downside = values < 0
+    n_downside = int(np.count_nonzero(downside))
+    if n_downside == 0:
+        return 0.0
+
+    # single downside value gives a nan std like pandas
+    downside_std = np.nan
+    if n_downside > 1:
+        downside_mean = np.where(downside, values, 0.0).sum() / n_downside
+        downside_ssq = np.where(downside, (values - downside_mean) ** 2, 0.0).sum()
+        downside_std = np.sqrt(downside_ssq / (n_downside - 1))
 
-    if len(downside_returns) == 0 or downside_returns.std() == 0:
+    if downside_std == 0:
         return 0.0
 
-    sortino = np.sqrt(periods_per_year) * excess_returns.mean() / downside_returns.std()
+    sortino = np.sqrt(periods_per_year) * (returns.mean() - period_risk_free_rate) / downside_std
 
     return sortino
 
+@njit(cache=True, error_model='numpy')
+def _max_drawdown(values: np.ndarray) -> float:
+    # running growth and peak in one pass, no cumulative arrays
+    # nan returns and nan drawdowns are skipped like the pandas reductions
+    growth = 1.0
+    peak = np.nan
+    worst = np.nan
+    for x in values:
+        if np.isnan(x):
+            continue
+        growth *= 1 + x
+        if np.isnan(peak) or growth > peak:
+            peak = growth
+        drawdown = (growth - peak) / peak
+        if np.isnan(worst) or drawdown < worst:
+            worst = drawdown
+    return worst
+
 def calculate_max_drawdown(returns: pd.Series) -> float:
     # maximum drawdown from peak to trough
-    cumulative = (1 + returns).cumprod()
-    running_max = cumulative.cummax()
-    drawdown = (cumulative - running_max) / running_max
-
-    return drawdown.min()
+    return _max_drawdown(np.ascontiguousarray(returns, dtype=np.float64))
 
 def calculate_calmar_ratio(
     returns: pd.Series,
@@ -113,21 +140,129 @@ def calculate_volatility(
     # annualized volatility
     return returns.std() * np.sqrt(periods_per_year)
 
+@njit(cache=True, error_model='numpy')
+def _fused_stats(values: np.ndarray, period_risk_free_rate: float) -> tuple:
+    # every reduction calculate_all_metrics needs in one pass over the returns
+    # nan entries are skipped except in the nonzero count, like the series helpers
+    # variances use welford updates, drawdown tracks the running growth peak
+    n = 0
+    total = 0.0
+    excess_total = 0.0
+    mean = 0.0
+    m2 = 0.0
+
+    down_n = 0
+    down_mean = 0.0
+    down_m2 = 0.0
+
+    growth = 1.0
+    peak = 1.0
+    max_dd = np.nan
+
+    nonzero = 0
+    wins = 0
+    gross_profit = 0.0
+    gross_loss = 0.0
+
+    for x in values:
+        if x != 0:
+            nonzero += 1
+        if np.isnan(x):
+            continue
+
+        n += 1
+        total += x
+        excess_total += x - period_risk_free_rate
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+
+        growth *= 1 + x
+        if n == 1 or growth > peak:
+            peak = growth
+        drawdown = (growth - peak) / peak
+        if n == 1 or drawdown < max_dd or np.isnan(drawdown):
+            max_dd = drawdown
+
+        if x > 0:
+            wins += 1
+            gross_profit += x
+        elif x < 0:
+            gross_loss -= x
+            down_n += 1
+            delta = x - down_mean
+            down_mean += delta / down_n
+            down_m2 += delta * (x - down_mean)
+
+    return (
+        n, total, excess_total, m2, growth, max_dd,
+        down_n, down_m2, nonzero, wins, gross_profit, gross_loss
+    )
+
 def calculate_all_metrics(
-    returns: pd.Series,
+    returns: Union[pd.Series, np.ndarray],
     risk_free_rate: float = 0.0,
     periods_per_year: int = 252
 ) -> dict:
-    # calculate all performance metrics at once
+    # calculate all performance metrics at once from one fused numba pass
+    # accepts a series or array, nan entries are skipped like pandas reductions
+    values = np.ascontiguousarray(returns, dtype=np.float64)
+    n_periods = len(values)
+    period_risk_free_rate = risk_free_rate / periods_per_year
+
+    (
+        n_clean, total, excess_total, m2, growth, max_dd,
+        down_n, down_m2, nonzero, wins, gross_profit, gross_loss
+    ) = _fused_stats(values, period_risk_free_rate)
+
+    # sample stds are nan for fewer than two values like pandas
+    mean = total / n_clean if n_clean > 0 else np.nan
+    excess_mean = excess_total / n_clean if n_clean > 0 else np.nan
+    std = np.sqrt(m2 / (n_clean - 1)) if n_clean > 1 else np.nan
+    downside_std = np.sqrt(down_m2 / (down_n - 1)) if down_n > 1 else np.nan
+    total_return = growth - 1 if n_clean > 0 else 0.0
+
+    if n_periods == 0:
+        annual_return = 0.0
+    else:
+        years = n_periods / periods_per_year
+        annual_return = (1 + total_return) ** (1 / years) - 1
+
+    if std == 0:
+        sharpe = 0.0
+    else:
+        sharpe = np.sqrt(periods_per_year) * excess_mean / std
+
+    if down_n == 0 or downside_std == 0:
+        sortino = 0.0
+    else:
+        sortino = np.sqrt(periods_per_year) * excess_mean / downside_std
+
+    if max_dd == 0:
+        calmar = 0.0
+    else:
+        calmar = ((1 + mean) ** periods_per_year - 1) / abs(max_dd)
+
+    # nan entries count as nonzero periods, matching the series version
+    if n_periods == 0 or nonzero == 0:
+        win_rate = 0.0
+    else:
+        win_rate = wins / nonzero
+
+    if gross_loss == 0:
+        profit_factor = np.inf if gross_profit > 0 else 0.0
+    else:
+        profit_factor = gross_profit / gross_loss
+
     return {
-        'annual_return': calculate_annual_return(returns, periods_per_year),
-        'volatility': calculate_volatility(returns, periods_per_year),
-        'sharpe_ratio': calculate_sharpe_ratio(returns, risk_free_rate, periods_per_year),
-        'sortino_ratio': calculate_sortino_ratio(returns, risk_free_rate, periods_per_year),
-        'max_drawdown': calculate_max_drawdown(returns),
-        'calmar_ratio': calculate_calmar_ratio(returns, periods_per_year),
-        'win_rate': calculate_win_rate(returns),
-        'profit_factor': calculate_profit_factor(returns),
-        'total_return': (1 + returns).prod() - 1,
-        'num_periods': len(returns)
+        'annual_return': annual_return,
+        'volatility': std * np.sqrt(periods_per_year),
+        'sharpe_ratio': sharpe,
+        'sortino_ratio': sortino,
+        'max_drawdown': max_dd,
+        'calmar_ratio': calmar,
+        'win_rate': win_rate,
+        'profit_factor': profit_factor,
+        'total_return': total_return,
+        'num_periods': n_periods
     }
@@ -5,6 +5,11 @@ import pandas as pd
 # base class for all trading strategies
 class Strategy(ABC):
 
+    # true when the signal at each bar only uses data up to that bar, so
+    # signals can be computed once over a full series and sliced per window
+    # indicators in a slice are then warmed up on the bars before it
+    is_causal: bool = False
+
     def __init__(self, name: str, parameters: Dict[str, Any] = None):
         self.name = name
         self.parameters = parameters or {}
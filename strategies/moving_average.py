@@ -1,11 +1,110 @@
+import numpy as np
 import pandas as pd
+from numba import njit, prange
 from .base import Strategy
 
+
+@njit(cache=True)
+def _fast_slow_means(close: np.ndarray, fast: int, slow: int) -> np.ndarray:
+    # fast and slow rolling means of close in one pass, rows (fast, slow)
+    # mirrors pandas rolling().mean() bit for bit: separate compensated sums
+    # for adds and removes, nan until the window holds that many observations,
+    # constant runs return the value itself and sign-consistent windows clamp
+    n = len(close)
+    windows = np.array([fast, slow])
+    out = np.full((2, n), np.nan)
+
+    sums = np.zeros(2)
+    add_comps = np.zeros(2)
+    remove_comps = np.zeros(2)
+    nobs = np.zeros(2, dtype=np.int64)
+    neg_ct = np.zeros(2, dtype=np.int64)
+    same_ct = np.zeros(2, dtype=np.int64)
+    prev = np.full(2, np.nan)
+
+    for i in range(n):
+        for j in range(2):
+            window = windows[j]
+
+            if window == 1:
+                # non-overlapping windows restart from scratch like pandas
+                sums[j] = 0.0
+                add_comps[j] = 0.0
+                remove_comps[j] = 0.0
+                nobs[j] = 0
+                neg_ct[j] = 0
+                same_ct[j] = 0
+                prev[j] = np.nan
+            elif i >= window:
+                x = close[i - window]
+                if not np.isnan(x):
+                    nobs[j] -= 1
+                    y = -x - remove_comps[j]
+                    t = sums[j] + y
+                    remove_comps[j] = t - sums[j] - y
+                    sums[j] = t
+                    if np.signbit(x):
+                        neg_ct[j] -= 1
+
+            x = close[i]
+            if not np.isnan(x):
+                nobs[j] += 1
+                y = x - add_comps[j]
+                t = sums[j] + y
+                add_comps[j] = t - sums[j] - y
+                sums[j] = t
+                if np.signbit(x):
+                    neg_ct[j] += 1
+                if x == prev[j]:
+                    same_ct[j] += 1
+                else:
+                    same_ct[j] = 1
+                prev[j] = x
+
+            if nobs[j] >= window:
+                mean = sums[j] / nobs[j]
+                if same_ct[j] >= nobs[j]:
+                    mean = prev[j]
+                elif neg_ct[j] == 0 and mean < 0:
+                    mean = 0.0
+                elif neg_ct[j] == nobs[j] and mean > 0:
+                    mean = 0.0
+                out[j, i] = mean
+
+    return out
+
+@njit(cache=True)
+def _cross_signals(close: np.ndarray, fast: int, slow: int, out: np.ndarray):
+    # crossover signals for one (fast, slow) pair written into out
+    # same rules as generate_signals: 0 position while warming up, nan first bar
+    means = _fast_slow_means(close, fast, slow)
+    prev = 0.0
+    for i in range(len(close)):
+        position = np.sign(means[0, i] - means[1, i])
+        if np.isnan(position):
+            position = 0.0
+        if i == 0:
+            out[i] = np.nan
+        else:
+            out[i] = min(max(position - prev, -1.0), 1.0)
+        prev = position
+
+@njit(parallel=True, cache=True)
+def _batch_ma_cross(close: np.ndarray, fast_arr: np.ndarray, slow_arr: np.ndarray) -> np.ndarray:
+    # one row of signals per parameter pair, pairs run in parallel over the shared close
+    out = np.empty((len(fast_arr), len(close)))
+    for k in prange(len(fast_arr)):
+        _cross_signals(close, fast_arr[k], slow_arr[k], out[k])
+    return out
+
 # ma crossover strategy
 # buy when fast ma crosses above slow ma
 # sell when fast ma crosses below slow ma
 class MovingAverageCrossover(Strategy):
 
+    # rolling means only look back, full-series signals carry no lookahead
+    is_causal = True
+
     def __init__(self, fast_period: int = 20, slow_period: int = 50):
         if fast_period <= 0 or slow_period <= 0:
             raise ValueError("fast_period and slow_period must be positive")
@@ -29,21 +128,42 @@ class MovingAverageCrossover(Strategy):
         if 'close' not in data.columns:
             raise ValueError("data must contain 'close' column")
 
-        fast_ma = data['close'].rolling(window=self.fast_period).mean()
-        slow_ma = data['close'].rolling(window=self.slow_period).mean()
+        # moving averages, position sign, change and clip to -1/0/1 all run in
+        # the numba kernel, which writes the final signals into one array
+        # position is 0 while either ma is warming up, the first bar has no prior
+        signals = np.empty(len(data))
+        _cross_signals(
+            data['close'].to_numpy(dtype=np.float64),
+            self.fast_period,
+            self.slow_period,
+            signals
+        )
 
-        signals = pd.Series(0, index=data.index)
+        return pd.Series(signals, index=data.index, name='signal')
 
-        # create position series: 1 when fast > slow, -1 otherwise
-        position = pd.Series(0, index=data.index)
-        position[fast_ma > slow_ma] = 1
-        position[fast_ma < slow_ma] = -1
+    @classmethod
+    def batch_signals(cls, data: pd.DataFrame, params) -> pd.DataFrame:
+        # signals for many (fast_period, slow_period) pairs over the same data
+        # one column per pair, identical to generate_signals for each one
+        if 'close' not in data.columns:
+            raise ValueError("data must contain 'close' column")
 
-        # convert positions to signals (only on changes)
-        signals = position.diff()
+        params = np.asarray(params, dtype=np.int64).reshape(-1, 2)
+        fast_arr = np.ascontiguousarray(params[:, 0])
+        slow_arr = np.ascontiguousarray(params[:, 1])
+        if (fast_arr <= 0).any() or (slow_arr <= 0).any():
+            raise ValueError("fast_period and slow_period must be positive")
+        if (fast_arr >= slow_arr).any():
+            raise ValueError("fast_period must be less than slow_period for every pair")
 
-        # normalize to -1, 0, 1
-        signals[signals > 0] = 1
-        signals[signals < 0] = -1
+        signals = _batch_ma_cross(
+            data['close'].to_numpy(dtype=np.float64),
+            fast_arr,
+            slow_arr
+        )
 
-        return signals
+        columns = pd.MultiIndex.from_arrays(
+            [fast_arr, slow_arr],
+            names=['fast_period', 'slow_period']
+        )
+        return pd.DataFrame(signals.T, index=data.index, columns=columns)
@@ -0,0 +1,81 @@
+import os
+import subprocess
+import sys
+import textwrap
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from backtester import Backtester
+from strategies import MovingAverageCrossover
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _frame(n: int = 600, seed: int = 0) -> pd.DataFrame:
+    # random-walk ohlcv on a daily index
+    close = 100 * np.exp(np.cumsum(np.random.default_rng(seed).normal(0, 0.02, n)))
+    return pd.DataFrame(
+        {'open': close, 'high': close, 'low': close, 'close': close, 'volume': 1.0},
+        index=pd.date_range('2020-01-01', periods=n, freq='D')
+    )
+
+
+class TestParallelDispatch(unittest.TestCase):
+
+    def test_small_workloads_run_in_process(self):
+        backtester = Backtester()
+        strategies = [MovingAverageCrossover(5, 20), MovingAverageCrossover(10, 50)]
+        executor_cls, workers = backtester._executor_cls(strategies, len(strategies), 600)
+        self.assertIsNone(executor_cls)
+        self.assertEqual(workers, 1)
+
+    def test_explicit_workers_match_sequential(self):
+        data = _frame()
+        strategies = [MovingAverageCrossover(5, 20), MovingAverageCrossover(10, 50)]
+        backtester = Backtester()
+        sequential = backtester.run_multiple(strategies, data, max_workers=1)
+        parallel = backtester.run_multiple(strategies, data, max_workers=2)
+        for name, result in sequential.items():
+            pd.testing.assert_series_equal(parallel[name].equity_curve, result.equity_curve)
+
+    def test_unloadable_strategy_falls_back_to_threads(self):
+        # a strategy defined in __main__ of a file-less script pickles in the parent
+        # but cannot be imported by spawn workers, which breaks the process pool
+        script = textwrap.dedent("""
+            import multiprocessing
+            import numpy as np
+            import pandas as pd
+            from backtester import Backtester
+            from strategies import MovingAverageCrossover
+
+            class LocalCrossover(MovingAverageCrossover):
+                pass
+
+            if __name__ == '__main__':
+                multiprocessing.set_start_method('spawn')
+                close = 100 * np.exp(np.cumsum(np.random.default_rng(0).normal(0, 0.02, 400)))
+                data = pd.DataFrame({'close': close}, index=pd.date_range('2020-01-01', periods=400))
+                backtester = Backtester()
+                windows = backtester.walk_forward_analysis(
+                    LocalCrossover(5, 20), data, train_size=100, test_size=50,
+                    step_size=50, max_workers=2
+                )
+                expected = backtester.walk_forward_analysis(
+                    LocalCrossover(5, 20), data, train_size=100, test_size=50,
+                    step_size=50, max_workers=1
+                )
+                assert [w.final_capital for w in windows] == [w.final_capital for w in expected]
+                print(len(windows))
+        """)
+        completed = subprocess.run(
+            [sys.executable, '-c', script], cwd=ROOT,
+            capture_output=True, text=True, timeout=300
+        )
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertEqual(completed.stdout.strip(), '6')
+
+
+if __name__ == '__main__':
+    unittest.main()
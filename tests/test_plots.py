@@ -0,0 +1,95 @@
+import unittest
+
+import matplotlib
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from strategies import MovingAverageCrossover
+from visualization import create_performance_dashboard, plot_rolling_metrics
+
+
+def _returns(n: int = 300, seed: int = 0) -> pd.Series:
+    # daily returns short enough to be plotted without downsampling
+    return pd.Series(
+        np.random.default_rng(seed).normal(0.0005, 0.02, n),
+        index=pd.date_range('2020-01-01', periods=n, freq='D')
+    )
+
+
+class TestRollingMetrics(unittest.TestCase):
+
+    def tearDown(self):
+        plt.close('all')
+
+    def test_lines_match_pandas(self):
+        returns = _returns()
+        window = 20
+        fig = plot_rolling_metrics(returns, window=window)
+        ax1, ax2, ax3 = fig.axes
+
+        rolling_return = returns.rolling(window).mean() * window
+        rolling_vol = returns.rolling(window).std() * np.sqrt(window)
+        np.testing.assert_allclose(ax1.lines[0].get_ydata(), rolling_return, rtol=1e-12)
+        np.testing.assert_allclose(ax2.lines[0].get_ydata(), rolling_vol, rtol=1e-10)
+        np.testing.assert_allclose(
+            ax3.lines[0].get_ydata(), rolling_return / rolling_vol, rtol=1e-10
+        )
+
+    def test_window_one_sharpe_is_a_gap(self):
+        fig = plot_rolling_metrics(_returns(), window=1)
+        sharpe = np.asarray(fig.axes[2].lines[0].get_ydata(), dtype=np.float64)
+        self.assertFalse(np.isinf(sharpe).any())
+        self.assertTrue(np.isnan(sharpe).all())
+
+
+class TestDashboardReuse(unittest.TestCase):
+
+    def tearDown(self):
+        plt.close('all')
+
+    def _inputs(self, n: int, seed: int):
+        returns = _returns(n, seed)
+        close = 100 * (1 + returns).cumprod()
+        data = pd.DataFrame({'close': close}, index=returns.index)
+        signals = MovingAverageCrossover(5, 20).generate_signals(data)
+        return data, returns, signals
+
+    def _artists(self, fig) -> list:
+        # counts of every artist kind per axes, plus figure-level texts
+        return [len(fig.texts)] + [
+            (len(ax.lines), len(ax.patches), len(ax.collections), len(ax.tables), len(ax.texts))
+            for ax in fig.axes
+        ]
+
+    def test_reused_figure_is_cleared(self):
+        first = create_performance_dashboard(
+            *self._inputs(400, 1), {'sharpe_ratio': 2.0}, title='first', reuse_figure=True
+        )
+        fresh = create_performance_dashboard(*self._inputs(200, 2), {}, title='second')
+        expected = self._artists(fresh)
+
+        reused = create_performance_dashboard(
+            *self._inputs(200, 2), {}, title='second', reuse_figure=True
+        )
+        self.assertIs(reused, first)
+        self.assertEqual(len(reused.axes), 5)
+        self.assertEqual(self._artists(reused), expected)
+        self.assertEqual(reused._suptitle.get_text(), 'second')
+        np.testing.assert_array_equal(
+            reused.axes[0].lines[0].get_ydata(), fresh.axes[0].lines[0].get_ydata()
+        )
+
+    def test_closed_cached_figure_is_replaced(self):
+        inputs = self._inputs(200, 3)
+        first = create_performance_dashboard(*inputs, {}, reuse_figure=True)
+        plt.close(first)
+        second = create_performance_dashboard(*inputs, {}, reuse_figure=True)
+        self.assertIsNot(second, first)
+        self.assertTrue(plt.fignum_exists(second.number))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from data import (
+    add_log_returns, add_returns, create_features, normalize_volume,
+    rolling_mean, rolling_std
+)
+
+
+def _prices(n: int = 2000, seed: int = 0) -> np.ndarray:
+    # random-walk closes with nan gaps, a constant run and a negative stretch
+    values = 100 * np.exp(np.cumsum(np.random.default_rng(seed).normal(0, 0.01, n)))
+    values[[3, 100, 101, 102, 1500]] = np.nan
+    values[300:340] = 5.0
+    values[700:720] *= -1
+    return values
+
+
+class TestRollingKernels(unittest.TestCase):
+
+    def test_match_pandas(self):
+        values = _prices()
+        series = pd.Series(values)
+        for window in (1, 2, 3, 20, 200):
+            with self.subTest(window=window):
+                np.testing.assert_allclose(
+                    rolling_mean(values, window),
+                    series.rolling(window).mean().to_numpy(),
+                    rtol=1e-12, atol=0
+                )
+                np.testing.assert_allclose(
+                    rolling_std(values, window),
+                    series.rolling(window).std().to_numpy(),
+                    rtol=1e-8, atol=1e-12
+                )
+
+    def test_std_is_nan_below_two_observations(self):
+        values = np.array([1.0, 2.0, np.nan, 4.0, 4.0, 7.0])
+        self.assertTrue(np.isnan(rolling_std(values, 1)).all())
+
+        std = rolling_std(values, 2)
+        expected = pd.Series(values).rolling(2).std().to_numpy()
+        np.testing.assert_array_equal(np.isnan(std), np.isnan(expected))
+        np.testing.assert_allclose(std, expected, rtol=1e-12)
+
+    def test_window_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            rolling_mean(np.ones(5), 0)
+        with self.assertRaises(ValueError):
+            rolling_std(np.ones(5), -1)
+
+    def test_create_features_match_pandas(self):
+        close = 100 * np.exp(np.cumsum(np.random.default_rng(2).normal(0, 0.01, 2000)))
+        data = pd.DataFrame({
+            'open': close, 'high': close * 1.01, 'low': close * 0.99, 'close': close,
+            'volume': np.random.default_rng(1).uniform(1, 10, len(close))
+        }, index=pd.date_range('2020-01-01', periods=len(close), freq='D'))
+
+        features = create_features(data)
+        for period in (10, 20, 50, 200):
+            np.testing.assert_allclose(
+                features[f'sma_{period}'], data['close'].rolling(period).mean(), rtol=1e-12
+            )
+        for period in (10, 20):
+            np.testing.assert_allclose(
+                features[f'volatility_{period}'],
+                features['returns'].rolling(period).std(), rtol=1e-8, atol=1e-12
+            )
+        np.testing.assert_allclose(
+            features['normalized_volume'],
+            data['volume'] / data['volume'].rolling(20).mean(), rtol=1e-12
+        )
+
+
+class TestReturns(unittest.TestCase):
+
+    def _data(self) -> pd.DataFrame:
+        # closes with nan gaps, including a run and the last bar, and a zero
+        close = 100 * np.exp(np.cumsum(np.random.default_rng(4).normal(0, 0.01, 300)))
+        close[[10, 11, 50, 299]] = np.nan
+        close[100] = 0.0
+        return pd.DataFrame({'close': close})
+
+    def test_returns_do_not_fill_nan_gaps(self):
+        data = self._data()
+        result = add_returns(data, periods=[1, 5, 20])
+        for period, column in ((1, 'returns'), (5, 'returns_5d'), (20, 'returns_20d')):
+            expected = data['close'].pct_change(periods=period, fill_method=None)
+            np.testing.assert_array_equal(result[column], expected)
+
+        # the bar after a gap has no previous close to compare against
+        self.assertTrue(np.isnan(result['returns'].iloc[12]))
+
+    def test_log_returns_match_pandas(self):
+        data = self._data()
+        result = add_log_returns(data, periods=[1, 5])
+        for period, column in ((1, 'log_returns'), (5, 'log_returns_5d')):
+            ratio = (data['close'] / data['close'].shift(period)).replace([0, np.inf, -np.inf], np.nan)
+            np.testing.assert_array_equal(result[column], np.log(ratio))
+
+
+class TestNormalizeVolume(unittest.TestCase):
+
+    def test_matches_pandasrolling_mean(self):
+        volume = np.random.default_rng(3).uniform(0, 10, 500)
+        volume[::37] = 0.0
+        volume[[5, 250]] = np.nan
+        data = pd.DataFrame({'volume': volume})
+
+        average = data['volume'].rolling(window=20).mean().replace(0, np.nan)
+        np.testing.assert_array_equal(
+            normalize_volume(data)['normalized_volume'], data['volume'] / average
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
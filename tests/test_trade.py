@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from backtester import Backtester
+from strategies import MovingAverageCrossover
+
+
+def _frame(n: int = 300, seed: int = 0) -> pd.DataFrame:
+    # random-walk ohlcv on a plain RangeIndex
+    close = 100 * np.exp(np.cumsum(np.random.default_rng(seed).normal(0, 0.02, n)))
+    return pd.DataFrame({
+        'open': close, 'high': close, 'low': close, 'close': close, 'volume': 1.0
+    })
+
+
+class TestRangeIndexBacktest(unittest.TestCase):
+
+    def test_run_without_datetime_index(self):
+        data = _frame()
+        result = Backtester().run(MovingAverageCrossover(5, 20), data)
+        self.assertGreater(result.num_trades, 0)
+
+        # holding periods fall back to the bar count difference
+        trades_df = result.get_trades_df()
+        expected = trades_df['exit_date'] - trades_df['entry_date']
+        np.testing.assert_array_equal(trades_df['holding_days'], expected)
+        self.assertAlmostEqual(result.avg_holding_period, expected.mean())
+        self.assertEqual(result.trades[0].holding_days, expected.iloc[0])
+
+    def test_share_counts_stay_integer(self):
+        data = _frame()
+        for engine in ('numba', 'python'):
+            with self.subTest(engine=engine):
+                result = Backtester(engine=engine).run(MovingAverageCrossover(5, 20), data)
+                self.assertEqual(result.get_trades_df()['shares'].dtype, np.int64)
+                self.assertIsInstance(result.trades[0].shares, int)
+
+    def test_holding_days_match_datetime_index(self):
+        data = _frame()
+        data.index = pd.date_range('2020-01-01', periods=len(data), freq='D')
+        result = Backtester().run(MovingAverageCrossover(5, 20), data)
+
+        expected = [t.holding_days for t in result.trades]
+        np.testing.assert_array_equal(result.get_trades_df()['holding_days'], expected)
+        self.assertAlmostEqual(result.avg_holding_period, np.mean(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,15 +1,145 @@
 # visualization functions for strategy analysis and performance reporting
+# the backend is left to the application: matplotlib already falls back to agg
+# without a display, batch runs can force it with MPLBACKEND=Agg
 
+import functools
+import threading
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import pandas as pd
 import numpy as np
 from typing import Optional, Tuple
 import seaborn as sns
+from numba import njit
+from data import rolling_mean, rolling_std
+
+# seaborn darkgrid and figure defaults merged once into a registered style,
+# applied only while a plot function runs, these are read when artists are created
+plt.style.library['trading_lab'] = {
+    **sns.axes_style("darkgrid"),
+    'figure.figsize': (12, 6)
+}
+
+# let agg merge near-collinear segments and draw long paths in chunks
+# agg reads these when the figure is drawn on savefig/show, after the style
+# context has exited, so they stay global
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
+
+# dashboard figures kept per thread and figsize for callers that opt into reuse
+_FIG_CACHE = threading.local()
+
+def _styled(func):
+    # run a plot function inside the shared style context
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with plt.style.context('trading_lab'):
+            return func(*args, **kwargs)
+    return wrapper
+
+# lines over this many points are rasterized in vector output, marker sets
+# over the marker limit are drawn as a line2d instead of a scatter collection
+_RASTERIZE_POINTS = 5000
+_SCATTER_MARKERS = 1000
+
+def _plot_markers(ax, x, y, marker: str, color: str, size: float, **kwargs):
+    # buy/sell markers, scatter for a few points and a marker-only line for many
+    if len(x) > _SCATTER_MARKERS:
+        return ax.plot(x, y, marker=marker, linestyle='None', color=color,
+                       markersize=np.sqrt(size), **kwargs)
+    return ax.scatter(x, y, marker=marker, color=color, s=size, **kwargs)
+
+def _downsample_m4(x, y: np.ndarray, n_buckets: int) -> Tuple:
+    # m4 aggregation: keep the first, last, min and max point of each of
+    # n_buckets equal slices, the drawn polyline is unchanged at that width
+    y = np.asarray(y)
+    n = len(y)
+    buckets = np.arange(n) * n_buckets // n
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:] - 1, n - 1]
+    counts = np.diff(np.r_[starts, n])
+
+    # first row of each bucket that hits its min / max, all-nan buckets have none
+    keep = [starts, ends]
+    for extreme in (np.fmin.reduceat(y, starts), np.fmax.reduceat(y, starts)):
+        hits = np.flatnonzero(y == np.repeat(extreme, counts))
+        _, first = np.unique(buckets[hits], return_index=True)
+        keep.append(hits[first])
+
+    keep = np.unique(np.concatenate(keep))
+    return x[keep], y[keep]
+
+def _plot_points(x, y, figsize: Tuple[int, int]) -> Tuple:
+    # cap the vertices handed to matplotlib at ~4 per horizontal pixel
+    # (figure width at 100 dpi), shorter series are passed through as is
+    n_buckets = int(figsize[0] * 100)
+    if len(y) > 4 * n_buckets:
+        return _downsample_m4(x, y, n_buckets)
+    return x, y
+
+@njit(cache=True)
+def _moments(values: np.ndarray) -> Tuple[int, float, float, float, float]:
+    # count, mean and summed 2nd-4th central moments in one streaming pass
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    for x in values:
+        n1 = n
+        n += 1
+        delta = x - mean
+        delta_n = delta / n
+        delta_n2 = delta_n * delta_n
+        term = delta * delta_n * n1
+        mean += delta_n
+        m4 += term * delta_n2 * (n * n - 3 * n + 3) + 6 * delta_n2 * m2 - 4 * delta_n * m3
+        m3 += term * delta_n * (n - 2) - 3 * delta_n * m2
+        m2 += term
+    return n, mean, m2, m3, m4
+
+def _distribution_stats(values: np.ndarray) -> Tuple[float, float, float, float]:
+    # mean, sample std, skewness and excess kurtosis with pandas' bias
+    # corrections and small-sample nans, from one _moments pass
+    n, mean, m2, m3, m4 = _moments(values)
+    if n == 0:
+        return np.nan, np.nan, np.nan, np.nan
+
+    # round-off level moments count as zero like pandas
+    m2, m3 = (0.0 if abs(m) < 1e-14 else m for m in (m2, m3))
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+
+    skew = np.nan
+    if n >= 3:
+        skew = 0.0 if m2 == 0 else n * (n - 1) ** 0.5 / (n - 2) * m3 / m2 ** 1.5
+
+    kurtosis = np.nan
+    if n >= 4:
+        numerator = n * (n + 1) * (n - 1) * m4
+        denominator = (n - 2) * (n - 3) * m2 ** 2
+        numerator, denominator = (0.0 if abs(m) < 1e-14 else m for m in (numerator, denominator))
+        kurtosis = 0.0 if denominator == 0 else (
+            numerator / denominator - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+        )
+
+    return mean, std, skew, kurtosis
+
+def _equity_drawdown(returns: pd.Series, dtype=np.float64) -> Tuple[np.ndarray, np.ndarray]:
+    # growth of 1 and drawdown curves from raw arrays with numpy accumulate ufuncs
+    # nan returns leave the running product untouched and show as gaps,
+    # matching pandas cumprod/cummax skipna
+    # float32 is enough for curves that are only drawn, printed values stay float64
+    values = returns.to_numpy(dtype=dtype)
+    missing = np.isnan(values)
+    cumulative = np.cumprod(1 + np.where(missing, dtype(0), values), dtype=dtype)
+    running_max = np.maximum.accumulate(cumulative)
+    drawdown = (cumulative - running_max) / running_max
+    cumulative[missing] = np.nan
+    drawdown[missing] = np.nan
+    return cumulative, drawdown
 
-sns.set_style("darkgrid")
-plt.rcParams['figure.figsize'] = (12, 6)
-
+@_styled
 def plot_equity_curve(
     returns: pd.Series,
     title: str = "equity curve",
@@ -20,13 +150,17 @@ def plot_equity_curve(
     # plot equity curve from returns with optional benchmark
     fig, ax = plt.subplots(figsize=figsize)
 
-    equity = initial_capital * (1 + returns).cumprod()
-    ax.plot(equity.index, equity.values, linewidth=2, label='strategy', color='blue')
+    # the curves are only drawn, so they are compounded in float32
+    equity = np.float32(initial_capital) * _equity_drawdown(returns, np.float32)[0]
+    ax.plot(*_plot_points(returns.index, equity, figsize),
+            linewidth=2, label='strategy', color='blue',
+            rasterized=len(equity) > _RASTERIZE_POINTS)
 
     if benchmark_returns is not None:
-        benchmark_equity = initial_capital * (1 + benchmark_returns).cumprod()
-        ax.plot(benchmark_equity.index, benchmark_equity.values,
-                linewidth=2, label='benchmark', color='gray', alpha=0.7)
+        benchmark_equity = np.float32(initial_capital) * _equity_drawdown(benchmark_returns, np.float32)[0]
+        ax.plot(*_plot_points(benchmark_returns.index, benchmark_equity, figsize),
+                linewidth=2, label='benchmark', color='gray', alpha=0.7,
+                rasterized=len(benchmark_equity) > _RASTERIZE_POINTS)
 
     ax.set_title(title, fontsize=14, fontweight='bold')
     ax.set_xlabel('date', fontsize=12)
@@ -43,6 +177,7 @@ def plot_equity_curve(
     plt.tight_layout()
     return fig
 
+@_styled
 def plot_drawdown(
     returns: pd.Series,
     title: str = "drawdown chart",
@@ -51,13 +186,13 @@ def plot_drawdown(
     # plot drawdown chart showing peak-to-trough declines
     fig, ax = plt.subplots(figsize=figsize)
 
-    cumulative = (1 + returns).cumprod()
-    running_max = cumulative.cummax()
-    drawdown = (cumulative - running_max) / running_max
+    _, drawdown = _equity_drawdown(returns)
+    x, y = _plot_points(returns.index, drawdown, figsize)
+    rasterized = len(drawdown) > _RASTERIZE_POINTS
 
-    ax.fill_between(drawdown.index, drawdown.values, 0,
-                     alpha=0.3, color='red', label='drawdown')
-    ax.plot(drawdown.index, drawdown.values, linewidth=1, color='darkred')
+    ax.fill_between(x, y, 0,
+                     alpha=0.3, color='red', label='drawdown', rasterized=rasterized)
+    ax.plot(x, y, linewidth=1, color='darkred', rasterized=rasterized)
 
     ax.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
 
@@ -73,8 +208,9 @@ def plot_drawdown(
     ax.xaxis.set_major_locator(mdates.MonthLocator(interval=3))
     plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
 
-    max_dd_idx = drawdown.idxmin()
-    max_dd_value = drawdown.min()
+    max_dd_pos = np.nanargmin(drawdown)
+    max_dd_idx = returns.index[max_dd_pos]
+    max_dd_value = drawdown[max_dd_pos]
     ax.plot(max_dd_idx, max_dd_value, 'ro', markersize=10,
             label=f'max dd: {max_dd_value:.2%}')
     ax.legend(loc='lower left', fontsize=10)
@@ -82,6 +218,7 @@ def plot_drawdown(
     plt.tight_layout()
     return fig
 
+@_styled
 def plot_trades(
     data: pd.DataFrame,
     signals: pd.Series,
@@ -91,23 +228,27 @@ def plot_trades(
     # plot price chart with buy/sell signals overlaid
     fig, ax = plt.subplots(figsize=figsize)
 
-    ax.plot(data.index, data['close'], linewidth=1.5,
-            label='close price', color='black', alpha=0.7)
+    close = data['close'].to_numpy()
+    ax.plot(*_plot_points(data.index, close, figsize), linewidth=1.5,
+            label='close price', color='black', alpha=0.7,
+            rasterized=len(data) > _RASTERIZE_POINTS)
 
-    buy_signals = signals[signals == 1]
-    sell_signals = signals[signals == -1]
+    # positional masks on the data rows instead of label lookups per marker
+    signal_values = signals.reindex(data.index).to_numpy()
+    buy_mask = signal_values == 1
+    sell_mask = signal_values == -1
+    num_buy = int(buy_mask.sum())
+    num_sell = int(sell_mask.sum())
 
-    if len(buy_signals) > 0:
-        ax.scatter(buy_signals.index,
-                   data.loc[buy_signals.index, 'close'],
-                   marker='^', color='green', s=100, alpha=0.8,
-                   label=f'buy ({len(buy_signals)})', zorder=5)
+    if num_buy > 0:
+        _plot_markers(ax, data.index[buy_mask], close[buy_mask],
+                      marker='^', color='green', size=100, alpha=0.8,
+                      label=f'buy ({num_buy})', zorder=5)
 
-    if len(sell_signals) > 0:
-        ax.scatter(sell_signals.index,
-                   data.loc[sell_signals.index, 'close'],
-                   marker='v', color='red', s=100, alpha=0.8,
-                   label=f'sell ({len(sell_signals)})', zorder=5)
+    if num_sell > 0:
+        _plot_markers(ax, data.index[sell_mask], close[sell_mask],
+                      marker='v', color='red', size=100, alpha=0.8,
+                      label=f'sell ({num_sell})', zorder=5)
 
     ax.set_title(title, fontsize=14, fontweight='bold')
     ax.set_xlabel('date', fontsize=12)
@@ -122,6 +263,7 @@ def plot_trades(
     plt.tight_layout()
     return fig
 
+@_styled
 def plot_returns_distribution(
     returns: pd.Series,
     title: str = "returns distribution",
@@ -131,23 +273,29 @@ def plot_returns_distribution(
     fig, ax = plt.subplots(figsize=figsize)
 
     returns_clean = returns.dropna()
-    n, bins, patches = ax.hist(returns_clean, bins=50, alpha=0.7,
-                                color='blue', edgecolor='black')
+    values = returns_clean.to_numpy(dtype=np.float64)
+
+    # bin with np.histogram and draw the bars directly, skipping ax.hist's wrapper
+    counts, edges = np.histogram(values, bins=50)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+           alpha=0.7, color='blue', edgecolor='black')
+
+    # all summary statistics from one moments pass plus a median selection
+    mean_return, std_return, skew_return, kurtosis_return = _distribution_stats(values)
+    median_return = np.median(values) if len(values) > 0 else np.nan
 
-    mean_return = returns_clean.mean()
     ax.axvline(mean_return, color='red', linestyle='--',
                linewidth=2, label=f'mean: {mean_return:.2%}')
 
-    median_return = returns_clean.median()
     ax.axvline(median_return, color='green', linestyle='--',
                linewidth=2, label=f'median: {median_return:.2%}')
 
     stats_text = f"""
     mean: {mean_return:.2%}
     median: {median_return:.2%}
-    std dev: {returns_clean.std():.2%}
-    skewness: {returns_clean.skew():.2f}
-    kurtosis: {returns_clean.kurtosis():.2f}
+    std dev: {std_return:.2%}
+    skewness: {skew_return:.2f}
+    kurtosis: {kurtosis_return:.2f}
     """
     ax.text(0.02, 0.98, stats_text, transform=ax.transAxes,
             fontsize=10, verticalalignment='top',
@@ -164,6 +312,7 @@ def plot_returns_distribution(
     plt.tight_layout()
     return fig
 
+@_styled
 def plot_rolling_metrics(
     returns: pd.Series,
     window: int = 252,
@@ -173,26 +322,30 @@ def plot_rolling_metrics(
     # plot rolling sharpe ratio and volatility over time
     fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=figsize, sharex=True)
 
-    rolling_return = returns.rolling(window=window).mean() * window
-    rolling_vol = returns.rolling(window=window).std() * np.sqrt(window)
+    # rolling mean and std from the shared numba window kernels, std is nan
+    # below two observations so window=1 leaves a gap instead of an inf sharpe
+    values = returns.to_numpy(dtype=np.float64)
+    rolling_return = pd.Series(rolling_mean(values, window) * window, index=returns.index)
+    rolling_vol = pd.Series(rolling_std(values, window) * np.sqrt(window), index=returns.index)
     rolling_sharpe = rolling_return / rolling_vol
+    rasterized = len(returns) > _RASTERIZE_POINTS
 
-    ax1.plot(rolling_return.index, rolling_return.values,
-             linewidth=2, color='blue')
+    ax1.plot(*_plot_points(rolling_return.index, rolling_return.values, figsize),
+             linewidth=2, color='blue', rasterized=rasterized)
     ax1.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
     ax1.set_title(f'{title} (window: {window} periods)', fontsize=14, fontweight='bold')
     ax1.set_ylabel('annualized return', fontsize=11)
     ax1.grid(True, alpha=0.3)
     ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.1%}'))
 
-    ax2.plot(rolling_vol.index, rolling_vol.values,
-             linewidth=2, color='orange')
+    ax2.plot(*_plot_points(rolling_vol.index, rolling_vol.values, figsize),
+             linewidth=2, color='orange', rasterized=rasterized)
     ax2.set_ylabel('annualized volatility', fontsize=11)
     ax2.grid(True, alpha=0.3)
     ax2.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.1%}'))
 
-    ax3.plot(rolling_sharpe.index, rolling_sharpe.values,
-             linewidth=2, color='green')
+    ax3.plot(*_plot_points(rolling_sharpe.index, rolling_sharpe.values, figsize),
+             linewidth=2, color='green', rasterized=rasterized)
     ax3.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
     ax3.axhline(y=1, color='gray', linestyle='--', linewidth=1, alpha=0.5)
     ax3.set_ylabel('sharpe ratio', fontsize=11)
@@ -206,31 +359,53 @@ def plot_rolling_metrics(
     plt.tight_layout()
     return fig
 
+@_styled
 def plot_monthly_returns_heatmap(
     returns: pd.Series,
     title: str = "monthly returns heatmap",
     figsize: Tuple[int, int] = (14, 8)
 ) -> plt.Figure:
     # plot heatmap of monthly returns by year
-    monthly_returns = (1 + returns).resample('M').prod() - 1
-
-    monthly_returns_df = pd.DataFrame({
-        'year': monthly_returns.index.year,
-        'month': monthly_returns.index.month,
-        'return': monthly_returns.values
-    })
-
-    pivot_table = monthly_returns_df.pivot(index='year', columns='month', values='return')
+    # monthly compounding on raw arrays: one (year, month) key per bar and a
+    # product over each contiguous key run, filled straight into the grid
+    index = returns.index
+    first_year = index.year.min()
+    keys = (index.year.to_numpy() - first_year) * 12 + (index.month.to_numpy() - 1)
+    growth = 1 + np.nan_to_num(returns.to_numpy(dtype=np.float64), nan=0.0)
+    if not index.is_monotonic_increasing:
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        growth = growth[order]
+
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    first_key, last_key = keys[0], keys[-1]
+
+    # months inside the span with no bars compound to 0 like an empty resample bin
+    grid = np.full(((last_key // 12) + 1, 12), np.nan)
+    grid.flat[first_key:last_key + 1] = 0.0
+    grid.flat[keys[starts]] = np.multiply.reduceat(growth, starts) - 1
+
+    # only calendar months that occur in the span get a column
+    present = np.zeros(12, dtype=bool)
+    present[np.arange(first_key, last_key + 1) % 12] = True
+    grid = grid[:, present]
 
     month_names = ['jan', 'feb', 'mar', 'apr', 'may', 'jun',
                    'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
-    pivot_table.columns = [month_names[i-1] for i in pivot_table.columns]
+    month_labels = [name for name, shown in zip(month_names, present) if shown]
+    year_labels = list(range(first_year, first_year + len(grid)))
+
+    # cell labels formatted once up front, empty months are masked by seaborn
+    annot = np.array(
+        ['' if np.isnan(v) else f'{v:.1%}' for v in grid.flat], dtype=object
+    ).reshape(grid.shape)
 
     fig, ax = plt.subplots(figsize=figsize)
 
-    sns.heatmap(pivot_table, annot=True, fmt='.1%', cmap='RdYlGn',
+    sns.heatmap(grid, annot=annot, fmt='', cmap='RdYlGn',
                 center=0, cbar_kws={'label': 'returns'},
-                linewidths=0.5, ax=ax)
+                linewidths=0.5, ax=ax,
+                xticklabels=month_labels, yticklabels=year_labels)
 
     ax.set_title(title, fontsize=14, fontweight='bold')
     ax.set_xlabel('month', fontsize=12)
@@ -239,55 +414,82 @@ def plot_monthly_returns_heatmap(
     plt.tight_layout()
     return fig
 
+@_styled
 def create_performance_dashboard(
     data: pd.DataFrame,
     returns: pd.Series,
     signals: pd.Series,
     metrics: dict,
     title: str = "strategy performance dashboard",
-    figsize: Tuple[int, int] = (16, 12)
+    figsize: Tuple[int, int] = (16, 12),
+    *,
+    reuse_figure: bool = False
 ) -> plt.Figure:
     # create comprehensive performance dashboard with multiple plots
-    fig = plt.figure(figsize=figsize)
+    # reuse_figure clears and redraws one cached figure per figsize instead of
+    # building a new one, a figure returned by an earlier call is overwritten
+    # and a cached figure closed through pyplot is replaced
+    if reuse_figure:
+        figures = getattr(_FIG_CACHE, 'figs', None)
+        if figures is None:
+            figures = _FIG_CACHE.figs = {}
+        fig = figures.get(tuple(figsize))
+        if fig is None or not plt.fignum_exists(fig.number):
+            fig = figures[tuple(figsize)] = plt.figure(figsize=figsize)
+        else:
+            # drop the old axes before clearing so fig.clear() does not reset
+            # each one just to discard it
+            for ax in fig.axes:
+                fig.delaxes(ax)
+            fig.clear()
+    else:
+        fig = plt.figure(figsize=figsize)
     gs = fig.add_gridspec(3, 2, hspace=0.3, wspace=0.3)
 
+    # derived arrays computed once and shared by the panels below,
+    # the equity and drawdown panels carry no printed values so float32 is enough
+    equity, drawdown = _equity_drawdown(returns, np.float32)
+    close = data['close'].to_numpy()
+    signal_values = signals.reindex(data.index).to_numpy()
+    buy_mask = signal_values == 1
+    sell_mask = signal_values == -1
+
+    rasterized = len(returns) > _RASTERIZE_POINTS
+
     ax1 = fig.add_subplot(gs[0, 0])
-    equity = (1 + returns).cumprod()
-    ax1.plot(equity.index, equity.values, linewidth=2, color='blue')
+    ax1.plot(returns.index, equity, linewidth=2, color='blue', rasterized=rasterized)
     ax1.set_title('equity curve', fontweight='bold')
     ax1.set_ylabel('cumulative returns')
     ax1.grid(True, alpha=0.3)
     ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.2f}x'))
 
     ax2 = fig.add_subplot(gs[0, 1])
-    cumulative = (1 + returns).cumprod()
-    running_max = cumulative.cummax()
-    drawdown = (cumulative - running_max) / running_max
-    ax2.fill_between(drawdown.index, drawdown.values, 0,
-                     alpha=0.3, color='red')
-    ax2.plot(drawdown.index, drawdown.values, linewidth=1, color='darkred')
+    ax2.fill_between(returns.index, drawdown, 0,
+                     alpha=0.3, color='red', rasterized=rasterized)
+    ax2.plot(returns.index, drawdown, linewidth=1, color='darkred', rasterized=rasterized)
     ax2.set_title('drawdown', fontweight='bold')
     ax2.set_ylabel('drawdown')
     ax2.grid(True, alpha=0.3)
     ax2.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.1%}'))
 
     ax3 = fig.add_subplot(gs[1, :])
-    ax3.plot(data.index, data['close'], linewidth=1.5, color='black', alpha=0.7)
-    buy_signals = signals[signals == 1]
-    sell_signals = signals[signals == -1]
-    if len(buy_signals) > 0:
-        ax3.scatter(buy_signals.index, data.loc[buy_signals.index, 'close'],
-                    marker='^', color='green', s=80, alpha=0.8, zorder=5)
-    if len(sell_signals) > 0:
-        ax3.scatter(sell_signals.index, data.loc[sell_signals.index, 'close'],
-                    marker='v', color='red', s=80, alpha=0.8, zorder=5)
+    ax3.plot(data.index, close, linewidth=1.5, color='black', alpha=0.7,
+             rasterized=len(data) > _RASTERIZE_POINTS)
+    if buy_mask.any():
+        _plot_markers(ax3, data.index[buy_mask], close[buy_mask],
+                      marker='^', color='green', size=80, alpha=0.8, zorder=5)
+    if sell_mask.any():
+        _plot_markers(ax3, data.index[sell_mask], close[sell_mask],
+                      marker='v', color='red', size=80, alpha=0.8, zorder=5)
     ax3.set_title('price chart with trade signals', fontweight='bold')
     ax3.set_ylabel('price ($)')
     ax3.grid(True, alpha=0.3)
 
     ax4 = fig.add_subplot(gs[2, 0])
     returns_clean = returns.dropna()
-    ax4.hist(returns_clean, bins=50, alpha=0.7, color='blue', edgecolor='black')
+    counts, edges = np.histogram(returns_clean.to_numpy(dtype=np.float64), bins=50)
+    ax4.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+            alpha=0.7, color='blue', edgecolor='black')
     ax4.axvline(returns_clean.mean(), color='red', linestyle='--', linewidth=2)
     ax4.set_title('returns distribution', fontweight='bold')
     ax4.set_xlabel('returns')